@@ -114,7 +114,7 @@ class BaseConceptMapScorer:
             # 必須フィールドがすべて存在する行のみを含める
             has_all_fields = all(field in row for field in ["id", "antes", "conq"])
             if not has_all_fields:
-                logger.warning(f"必須フィールドが不足している行をスキップします: {row}")
+                logger.warning("必須フィールドが不足している行をスキップします: %s", row)
             return has_all_fields
 
         return cast(
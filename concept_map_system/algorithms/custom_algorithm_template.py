@@ -39,8 +39,9 @@ class CustomAlgorithm(BaseAlgorithm):
         Returns:
             Dict[str, Any]: 実行結果
         """
-        # ファイルの検証
-        self.validate_files(master_file, student_file)
+        # ファイルの検証（実行エンジンで検証済みの場合は省略）
+        if kwargs.get("validate", True):
+            self.validate_files(master_file, student_file)
 
         # オプションの取得
         options = self._extract_execution_options(**kwargs)
@@ -60,8 +61,8 @@ class CustomAlgorithm(BaseAlgorithm):
                 student_data = f.read()
 
             if debug:
-                self.logger.debug(f"模範解答ファイルサイズ: {len(master_data)} bytes")
-                self.logger.debug(f"生徒の回答ファイルサイズ: {len(student_data)} bytes")
+                self.logger.debug("模範解答ファイルサイズ: %d bytes", len(master_data))
+                self.logger.debug("生徒の回答ファイルサイズ: %d bytes", len(student_data))
 
             # 採点ロジックを実装
             # ...
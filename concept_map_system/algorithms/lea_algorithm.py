@@ -68,7 +68,9 @@ class LEAAlgorithm(BaseAlgorithm):
         Raises:
             LinkCSVError: 読み込みに失敗した場合
         """
-        self.logger.info(f"データを読み込み中: master={master_file}, student={student_file}")
+        self.logger.info(
+            "データを読み込み中: master=%s, student=%s", master_file, student_file
+        )
 
         answers = create_links_from_csv(master_file)
         if not answers:
@@ -81,8 +83,8 @@ class LEAAlgorithm(BaseAlgorithm):
             raise LinkCSVError(msg)
 
         if debug:
-            self.logger.debug(f"模範解答数: {len(answers)}個")
-            self.logger.debug(f"生徒の回答数: {len(student_links)}個")
+            self.logger.debug("模範解答数: %d個", len(answers))
+            self.logger.debug("生徒の回答数: %d個", len(student_links))
 
         return answers, student_links
 
@@ -221,7 +223,8 @@ class LEAAlgorithm(BaseAlgorithm):
         Raises:
             AlgorithmExecutionError: 採点中にエラーが発生した場合
         """
-        self.validate_files(master_file, student_file)
+        if kwargs.get("validate", True):
+            self.validate_files(master_file, student_file)
 
         options = self._extract_execution_options(**kwargs)
         verbose = options["verbose"]
@@ -248,7 +251,9 @@ class LEAAlgorithm(BaseAlgorithm):
             msg = f"{constants.AlgorithmNames.LEA}採点中のデータエラー: {e!s}"
             raise AlgorithmExecutionError(msg) from e
         except Exception as e:
-            self.logger.exception(f"{constants.AlgorithmNames.LEA}採点中に予期しないエラーが発生しました")
+            self.logger.exception(
+                "%s採点中に予期しないエラーが発生しました", constants.AlgorithmNames.LEA
+            )
             msg = f"{constants.AlgorithmNames.LEA}採点中に予期しないエラーが発生しました: {e!s}"
             raise AlgorithmExecutionError(msg) from e
 
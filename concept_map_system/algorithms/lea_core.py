@@ -140,7 +140,7 @@ def calculate_optimal_matching_bruteforce(
         # Case 1: 模範解答数 ≤ 学習者解答数
         # 学習者解答から n_answers 個を選択
         if verbose:
-            logger.debug(f"ケース1: 学習者解答{n_students}個から{n_answers}個を選択")
+            logger.debug("ケース1: 学習者解答%d個から%d個を選択", n_students, n_answers)
 
         answer_range = list(range(n_answers))
         best_score, best_matching, best_answer_indices, best_student_indices = (
@@ -158,7 +158,7 @@ def calculate_optimal_matching_bruteforce(
         # Case 2: 模範解答数 > 学習者解答数
         # 模範解答から n_students 個を選択
         if verbose:
-            logger.debug(f"ケース2: 模範解答{n_answers}個から{n_students}個を選択")
+            logger.debug("ケース2: 模範解答%d個から%d個を選択", n_answers, n_students)
 
         student_range = list(range(n_students))
         best_score, best_matching, best_answer_indices, best_student_indices = (
@@ -7,10 +7,8 @@
 """
 
 import argparse
-import json
 import sys
 import traceback
-from pathlib import Path
 from typing import Any, Dict, Union
 
 # アルゴリズムをインポート（自動登録）
@@ -27,6 +25,7 @@ from .utils import (
     AcademicTableFormatter,
     ResultFormatter,
     export_to_file,
+    save_json,
 )
 
 # アルゴリズムをインポートして登録
@@ -41,9 +40,7 @@ def save_json_output(output_path: str, data: Dict[str, Any]) -> None:
         output_path: 出力ファイルパス
         data: 保存するデータ
     """
-    path = Path(output_path)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    save_json(data, output_path)
     print(f"\n結果を {output_path} に保存しました")
 
 
@@ -130,7 +127,7 @@ def run_single_algorithm(args: argparse.Namespace) -> int:
     algorithm = AlgorithmRegistry.get_algorithm(args.algorithm)
 
     if not algorithm:
-        print_colored(f"エラー: アルゴリズム '{args.algorithm}' が見つかりません", "red")
+        print_colored(f"エラー: {constants.ERROR_ALGORITHM_NOT_FOUND.format(args.algorithm)}", "red")
         print("\n利用可能なアルゴリズムを表示するには: --list を使用してください")
         return 1
 
@@ -189,9 +186,14 @@ def run_single_algorithm(args: argparse.Namespace) -> int:
                     )
                     print(formatted)
 
-                # エクスポート
+                # エクスポート（CSVは文字列を経由せずファイルへ直接書き込む）
                 if args.export:
-                    export_to_file(formatted, args.export)
+                    if args.format == "csv":
+                        AcademicResultFormatter.export_result_summary_csv(
+                            result.result, args.export
+                        )
+                    else:
+                        export_to_file(formatted, args.export)
                     print()
                     print_colored(f"📄 結果をエクスポートしました: {args.export}", "green")
 
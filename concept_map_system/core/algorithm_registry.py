@@ -19,6 +19,8 @@ class AlgorithmRegistry:
 
     _instance: ClassVar[Optional["AlgorithmRegistry"]] = None
     _algorithms: ClassVar[Dict[str, Type[BaseAlgorithm]]] = {}
+    # get_algorithm_infoの結果のキャッシュ（登録内容が変わると破棄）
+    _info_cache: ClassVar[Dict[str, Dict]] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -38,10 +40,11 @@ class AlgorithmRegistry:
         name = instance.name
 
         if name in cls._algorithms:
-            logger.warning(f"アルゴリズム '{name}' は既に登録されています。上書きします。")
+            logger.warning("アルゴリズム '%s' は既に登録されています。上書きします。", name)
 
         cls._algorithms[name] = algorithm_class
-        logger.info(f"アルゴリズム '{name}' を登録しました")
+        cls._info_cache.pop(name, None)
+        logger.info("アルゴリズム '%s' を登録しました", name)
 
     @classmethod
     def unregister(cls, name: str) -> bool:
@@ -56,6 +59,7 @@ class AlgorithmRegistry:
         """
         if name in cls._algorithms:
             del cls._algorithms[name]
+            cls._info_cache.pop(name, None)
             return True
         return False
 
@@ -70,12 +74,25 @@ class AlgorithmRegistry:
         Returns:
             Optional[BaseAlgorithm]: アルゴリズムのインスタンス
         """
-        if name not in cls._algorithms:
+        algorithm_class = cls.get_algorithm_class(name)
+        if algorithm_class is None:
             return None
 
-        algorithm_class = cls._algorithms[name]
         return algorithm_class()  # type: ignore[call-arg]
 
+    @classmethod
+    def get_algorithm_class(cls, name: str) -> Optional[Type[BaseAlgorithm]]:
+        """
+        アルゴリズムクラスを取得（インスタンス化しない）
+
+        Args:
+            name: アルゴリズム名
+
+        Returns:
+            Optional[Type[BaseAlgorithm]]: アルゴリズムクラス
+        """
+        return cls._algorithms.get(name)
+
     @classmethod
     def list_algorithms(cls) -> List[str]:
         """
@@ -101,21 +118,30 @@ class AlgorithmRegistry:
         """
         アルゴリズムの情報を取得
 
+        情報はアルゴリズムのクラスだけで決まるため、初回取得時にキャッシュし、
+        以降はインスタンスを生成せずに返します。
+
         Args:
             name: アルゴリズム名
 
         Returns:
             Optional[Dict]: アルゴリズムの情報
         """
-        algorithm = cls.get_algorithm(name)
-        if algorithm:
-            return algorithm.get_info()
-        return None
+        info = cls._info_cache.get(name)
+        if info is None:
+            algorithm = cls.get_algorithm(name)
+            if algorithm is None:
+                return None
+            info = cls._info_cache[name] = algorithm.get_info()
+
+        # 呼び出し側での変更がキャッシュに及ばないようコピーを返す
+        return dict(info)
 
     @classmethod
     def clear(cls) -> None:
         """すべてのアルゴリズムを登録解除"""
         cls._algorithms.clear()
+        cls._info_cache.clear()
 
 
 def register_algorithm(algorithm_class: Type[BaseAlgorithm]) -> Type[BaseAlgorithm]:
@@ -7,9 +7,10 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, cast
 
 from .constants import ResultKeys
+from .exceptions import FileValidationError
 from .logging_config import get_logger
 
 
@@ -37,7 +38,8 @@ class BaseAlgorithm(ABC):
         Args:
             master_file: 模範解答のファイルパス
             student_file: 生徒の回答のファイルパス
-            **kwargs: 追加のオプション
+            **kwargs: 追加のオプション（validate=Falseの場合、実行エンジンで検証済みのため
+                ファイル検証を省略できる）
 
         Returns:
             Dict[str, Any]: 実行結果
@@ -59,6 +61,29 @@ class BaseAlgorithm(ABC):
                 }
         """
 
+    @staticmethod
+    def check_files(master_file: str, student_file: str) -> Optional[FileValidationError]:
+        """
+        ファイルが存在するか検証（例外を送出しない版）
+
+        インスタンスの状態に依存しないため、実行エンジンが複数アルゴリズム分を
+        まとめて一度だけ検証する際にもクラスから直接呼び出せます。
+
+        Args:
+            master_file: 模範解答のファイルパス
+            student_file: 生徒の回答のファイルパス
+
+        Returns:
+            Optional[FileValidationError]: 問題がある場合はエラー、問題がなければNone
+        """
+        if not Path(master_file).exists():
+            return FileValidationError(f"模範解答ファイルが見つかりません: {master_file}")
+
+        if not Path(student_file).exists():
+            return FileValidationError(f"生徒の回答ファイルが見つかりません: {student_file}")
+
+        return None
+
     def validate_files(self, master_file: str, student_file: str) -> bool:
         """
         ファイルが存在するか検証
@@ -69,17 +94,13 @@ class BaseAlgorithm(ABC):
 
         Returns:
             bool: ファイルが存在する場合True
-        """
-        master_path = Path(master_file)
-        student_path = Path(student_file)
-
-        if not master_path.exists():
-            msg = f"模範解答ファイルが見つかりません: {master_file}"
-            raise FileNotFoundError(msg)
 
-        if not student_path.exists():
-            msg = f"生徒の回答ファイルが見つかりません: {student_file}"
-            raise FileNotFoundError(msg)
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        error = self.check_files(master_file, student_file)
+        if error is not None:
+            raise FileNotFoundError(str(error))
 
         return True
 
@@ -134,12 +155,12 @@ class BaseAlgorithm(ABC):
             debug: デバッグモードが有効な場合True
         """
         if debug and self._has_data_attributes(scorer):
-            self.logger.debug(f"模範解答: {len(scorer.master_data)}行")
-            self.logger.debug(f"生徒の回答: {len(scorer.student_data)}行")
+            self.logger.debug("模範解答: %d行", len(scorer.master_data))
+            self.logger.debug("生徒の回答: %d行", len(scorer.student_data))
 
             if self._has_map_attributes(scorer):
-                self.logger.debug(f"展開後の模範命題: {len(scorer.master_map)}個")
-                self.logger.debug(f"展開後の生徒命題: {len(scorer.student_map)}個")
+                self.logger.debug("展開後の模範命題: %d個", len(scorer.master_map))
+                self.logger.debug("展開後の生徒命題: %d個", len(scorer.student_map))
 
     def _add_verbose_info(self, results: Dict[str, Any], scorer: Any, verbose: bool) -> None:
         """
@@ -203,7 +224,9 @@ class BaseAlgorithm(ABC):
             # 展開モードを設定
             expansion_mode = self._configure_scorer_expansion(scorer, expansion_mode, decompose_qualifiers)
 
-            self.logger.info(f"データを読み込み中: master={master_file}, student={student_file}")
+            self.logger.info(
+                "データを読み込み中: master=%s, student=%s", master_file, student_file
+            )
             scorer.load_data(master_file, student_file)
             self._log_data_info(scorer, debug)
             results = scorer.score_all()
@@ -215,7 +238,7 @@ class BaseAlgorithm(ABC):
             raise AlgorithmExecutionError(msg) from e
 
         except Exception as e:
-            self.logger.exception(f"{algorithm_name}採点中に予期しないエラーが発生しました")
+            self.logger.exception("%s採点中に予期しないエラーが発生しました", algorithm_name)
             msg = f"{algorithm_name}採点中に予期しないエラーが発生しました: {e!s}"
             raise AlgorithmExecutionError(msg) from e
 
@@ -285,8 +308,9 @@ class BaseAlgorithm(ABC):
         Returns:
             Dict[str, Any]: 採点結果
         """
-        # ファイルの検証
-        self.validate_files(master_file, student_file)
+        # ファイルの検証（実行エンジンで検証済みの場合は省略）
+        if kwargs.get("validate", True):
+            self.validate_files(master_file, student_file)
 
         # 共通オプションの抽出
         options = self._extract_execution_options(**kwargs)
@@ -6,6 +6,8 @@
 プロジェクト全体で使用する定数を一元管理します。
 """
 
+from typing import Final
+
 # アプリケーション情報
 APP_NAME = "概念マップ採点統合システム"
 APP_TITLE = "概念マップ採点統合システム"
@@ -42,6 +44,7 @@ STATUS_ERROR = "エラー"
 ERROR_NO_FILES = "模範解答と生徒の回答のCSVファイルを選択してください"
 ERROR_NO_ALGORITHM = "少なくとも1つのアルゴリズムを選択してください"
 ERROR_FILE_NOT_FOUND = "ファイルが見つかりません: {}"
+ERROR_ALGORITHM_NOT_FOUND = "アルゴリズム '{}' が見つかりません"
 ERROR_NO_RESULTS = "まず採点を実行してください"
 ERROR_DURING_SCORING = "採点中にエラーが発生しました: {}"
 ERROR_DURING_SAVE = "保存中にエラーが発生しました: {}"
@@ -70,6 +73,7 @@ SEPARATOR_WIDTH_EXTRA_LONG = 80
 
 # ファイル処理関連
 FILE_ENCODING = "utf-8-sig"
+CSV_BUFFER_SIZE = 1 << 20  # CSV読み書き時のバッファサイズ（1 MiB）
 
 # UI レイアウト関連
 UI_PADDING = 5
@@ -107,63 +111,68 @@ class ScoringConstants:
     """採点システムの定数"""
 
     # McClure方式のスコア
-    MCCLURE_PERFECT_MATCH = 3
-    MCCLURE_DIRECTION_MISMATCH = 2
-    MCCLURE_LABEL_MISMATCH = 1
-    MCCLURE_NO_MATCH = 0
+    MCCLURE_PERFECT_MATCH: Final = 3
+    MCCLURE_DIRECTION_MISMATCH: Final = 2
+    MCCLURE_LABEL_MISMATCH: Final = 1
+    MCCLURE_NO_MATCH: Final = 0
 
     # Novak方式のスコア
-    NOVAK_PERFECT_MATCH = 3
-    NOVAK_NO_MATCH = 0
-    NOVAK_LIMITATION_BONUS = 4
+    NOVAK_PERFECT_MATCH: Final = 3
+    NOVAK_NO_MATCH: Final = 0
+    NOVAK_LIMITATION_BONUS: Final = 4
 
     # 交差リンク（Conflict）スコア範囲
-    CROSS_LINK_MIN_SCORE = 0
-    CROSS_LINK_MAX_SCORE = 4
+    CROSS_LINK_MIN_SCORE: Final = 0
+    CROSS_LINK_MAX_SCORE: Final = 4
 
     # LEA (Link Evaluation Algorithm) のスコア
-    LEA_MAX_SCORE = 4
-    LEA_PERFECT_MATCH = 4
-    LEA_TYPE_MISMATCH = 3
-    LEA_PARTIAL_MATCH = 2
-    LEA_PARTIAL_TYPE_MISMATCH = 1
-    LEA_NO_MATCH = 0
+    LEA_MAX_SCORE: Final = 4
+    LEA_PERFECT_MATCH: Final = 4
+    LEA_TYPE_MISMATCH: Final = 3
+    LEA_PARTIAL_MATCH: Final = 2
+    LEA_PARTIAL_TYPE_MISMATCH: Final = 1
+    LEA_NO_MATCH: Final = 0
 
     # 特殊なリンクタイプ
-    CONFLICT_LINK_TYPE = "conflict"
-    JUNCTION_TYPE = "Junction"
+    CONFLICT_LINK_TYPE: Final = "conflict"
+    JUNCTION_TYPE: Final = "Junction"
 
 
 # 結果辞書のキー名
 class ResultKeys:
-    """結果辞書の標準キー名（エイリアス付き）"""
+    """
+    結果辞書の標準キー名（エイリアス付き）
+
+    キーはすべて識別子形式のリテラルのため、CPythonによって自動的にintern化されます。
+    結果辞書の検索でポインタ比較による高速パスが効くよう、識別子形式を維持してください。
+    """
 
     # 基本キー
-    METHOD = "method"
-    RESULTS = "results"
-    SCORE_COUNTS = "score_counts"
+    METHOD: Final = "method"
+    RESULTS: Final = "results"
+    SCORE_COUNTS: Final = "score_counts"
 
     # スコアリングキー（標準）
-    TOTAL_SCORE = "total_score"
-    RAW_SCORE = "raw_score"  # TOTAL_SCOREのエイリアス（主にLEA用）
-    MAX_SCORE = "max_score"
-    MAX_POSSIBLE_SCORE = "max_possible_score"  # MAX_SCOREのエイリアス（主にLEA用）
-    PERCENTAGE = "percentage"
-    SCORE_RATE = "score_rate"  # PERCENTAGEのエイリアス（0.0-1.0形式）
+    TOTAL_SCORE: Final = "total_score"
+    RAW_SCORE: Final = "raw_score"  # TOTAL_SCOREのエイリアス（主にLEA用）
+    MAX_SCORE: Final = "max_score"
+    MAX_POSSIBLE_SCORE: Final = "max_possible_score"  # MAX_SCOREのエイリアス（主にLEA用）
+    PERCENTAGE: Final = "percentage"
+    SCORE_RATE: Final = "score_rate"  # PERCENTAGEのエイリアス（0.0-1.0形式）
 
     # マッチングキー（標準）
-    MATCHED_COUNT = "matched_count"
-    MATCHED_PAIRS = "matched_pairs"  # MATCHED_COUNTのエイリアス（主にLEA用）
+    MATCHED_COUNT: Final = "matched_count"
+    MATCHED_PAIRS: Final = "matched_pairs"  # MATCHED_COUNTのエイリアス（主にLEA用）
 
     # カウントキー
-    TOTAL_PROPS = "total_props"
-    MASTER_PROPS = "master_props"
-    STUDENT_PROPS = "student_props"
+    TOTAL_PROPS: Final = "total_props"
+    MASTER_PROPS: Final = "master_props"
+    STUDENT_PROPS: Final = "student_props"
 
     # 評価指標
-    PRECISION = "precision"
-    RECALL = "recall"
-    F_VALUE = "f_value"
+    PRECISION: Final = "precision"
+    RECALL: Final = "recall"
+    F_VALUE: Final = "f_value"
 
 
 # ============================================================================
@@ -184,10 +193,10 @@ conq (ポルトガル語: "consequence") - 命題の終点/結果ノード
 """
 
 
-# ログメッセージ
-LOG_ALGORITHM_REGISTERED = "アルゴリズムが登録されました: {}"
-LOG_ALGORITHM_EXECUTION_START = "アルゴリズム実行開始: {}"
-LOG_ALGORITHM_EXECUTION_SUCCESS = "アルゴリズム実行成功: {} ({:.2f}秒)"
-LOG_ALGORITHM_EXECUTION_FAILURE = "アルゴリズム実行失敗: {} - {}"
+# ログメッセージ（logger.info(LOG_XXX, 引数...) の形で渡し、書式化はloggingに任せる）
+LOG_ALGORITHM_REGISTERED = "アルゴリズムが登録されました: %s"
+LOG_ALGORITHM_EXECUTION_START = "アルゴリズム実行開始: %s"
+LOG_ALGORITHM_EXECUTION_SUCCESS = "アルゴリズム実行成功: %s (%.2f秒)"
+LOG_ALGORITHM_EXECUTION_FAILURE = "アルゴリズム実行失敗: %s - %s"
 LOG_FILES_VALIDATED = "ファイルの検証が完了しました"
-LOG_LOADING_DATA = "データを読み込み中: {}"
+LOG_LOADING_DATA = "データを読み込み中: %s"
@@ -5,17 +5,41 @@
 複数のアルゴリズムを並列に実行する
 """
 
+import os
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from .algorithm_registry import AlgorithmRegistry
 from .base_algorithm import BaseAlgorithm
+from .constants import (
+    ERROR_ALGORITHM_NOT_FOUND,
+    LOG_ALGORITHM_EXECUTION_FAILURE,
+    LOG_ALGORITHM_EXECUTION_START,
+    LOG_ALGORITHM_EXECUTION_SUCCESS,
+)
+from .exceptions import ConceptMapSystemError
+from .logging_config import configure_worker_logging, get_log_queue, get_logger
+
+# ロガーの取得
+logger = get_logger(__name__)
 
 
 class ExecutionResult:
     """実行結果を表すクラス"""
 
+    # 大量に生成されるため、インスタンスごとの__dict__を持たせない
+    __slots__ = ("algorithm_name", "error", "execution_time", "result", "success")
+
     def __init__(
         self,
         algorithm_name: str,
@@ -58,36 +82,181 @@ class ExecutionResult:
         return ExecutionResult(
             algorithm_name=name,
             success=False,
-            error=f"アルゴリズム '{name}' が見つかりません",
+            error=ERROR_ALGORITHM_NOT_FOUND.format(name),
+        )
+
+    @staticmethod
+    def create_file_validation_failed(name: str, error: Exception) -> "ExecutionResult":
+        """
+        入力ファイルの検証に失敗した場合のExecutionResultを作成
+
+        Args:
+            name: アルゴリズム名
+            error: 検証エラー
+
+        Returns:
+            ExecutionResult: 失敗結果
+        """
+        return ExecutionResult(algorithm_name=name, success=False, error=str(error))
+
+
+def _resolve_algorithm_classes(
+    algorithm_names: List[str],
+) -> List[Tuple[str, Optional[Type[BaseAlgorithm]]]]:
+    """
+    アルゴリズム名をクラスに解決
+
+    同じ名前はレジストリを一度だけ参照します。インスタンスは状態を持ちうるため
+    共有せず、呼び出し側でジョブごとに生成してください。
+
+    Args:
+        algorithm_names: アルゴリズム名のリスト
+
+    Returns:
+        List[Tuple[str, Optional[Type[BaseAlgorithm]]]]: (名前, クラス) のリスト（未登録はNone）
+    """
+    classes = {name: AlgorithmRegistry.get_algorithm_class(name) for name in set(algorithm_names)}
+    return [(name, classes[name]) for name in algorithm_names]
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """
+    計測開始からの経過時間を秒単位で取得
+
+    Args:
+        start_ns: time.perf_counter_ns() で取得した計測開始時刻
+
+    Returns:
+        float: 経過時間（秒）
+    """
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+# 入力データに起因する想定内の例外（メッセージをそのまま利用者に提示する）
+_EXPECTED_ERRORS = (ConceptMapSystemError, OSError, ValueError)
+
+
+def _summarize_error(error: Exception) -> str:
+    """
+    例外から結果に格納する短いエラーメッセージを作成
+
+    想定外の例外は種類が分かるよう例外クラス名を付加します。
+
+    Args:
+        error: 発生した例外
+
+    Returns:
+        str: エラーメッセージ
+    """
+    message = str(error)
+    if isinstance(error, _EXPECTED_ERRORS):
+        return message
+    return f"{type(error).__name__}: {message}"
+
+
+def _run_one(
+    algorithm: BaseAlgorithm,
+    master_file: str,
+    student_file: str,
+    *,
+    skip_validation: bool = False,
+    **kwargs,
+) -> ExecutionResult:
+    """
+    単一のアルゴリズムを実行（各実行エンジン共通の処理）
+
+    Args:
+        algorithm: アルゴリズムインスタンス
+        master_file: 模範解答ファイル
+        student_file: 生徒の回答ファイル
+        skip_validation: 呼び出し側で検証済みの場合True（ファイル検証を省略）
+        **kwargs: 追加のオプション
+
+    Returns:
+        ExecutionResult: 実行結果
+    """
+    # 単調増加かつ高分解能なカウンタで計測（システム時刻の補正の影響を受けない）
+    start_ns = time.perf_counter_ns()
+    logger.debug(LOG_ALGORITHM_EXECUTION_START, algorithm.name)
+
+    # ファイルの検証（想定内のエラーは例外を使わずに結果として返す）
+    file_error = None if skip_validation else algorithm.check_files(master_file, student_file)
+    if file_error is not None:
+        return ExecutionResult(
+            algorithm_name=algorithm.name,
+            success=False,
+            error=str(file_error),
+            execution_time=_elapsed_seconds(start_ns),
+        )
+
+    if skip_validation:
+        # 検証済みであることをアルゴリズムに伝え、execute内での再検証を省く
+        kwargs["validate"] = False
+
+    # アルゴリズムの実行（予期しないエラーのみ例外で捕捉）
+    try:
+        result = algorithm.execute(master_file, student_file, **kwargs)
+    except Exception as e:
+        error = _summarize_error(e)
+        if isinstance(e, _EXPECTED_ERRORS):
+            logger.debug(LOG_ALGORITHM_EXECUTION_FAILURE, algorithm.name, error)
+        else:
+            # 想定外の例外のみトレースバックをログに一度だけ記録する
+            logger.exception(LOG_ALGORITHM_EXECUTION_FAILURE, algorithm.name, error)
+        return ExecutionResult(
+            algorithm_name=algorithm.name,
+            success=False,
+            error=error,
+            execution_time=_elapsed_seconds(start_ns),
         )
 
+    execution_time = _elapsed_seconds(start_ns)
+    logger.debug(LOG_ALGORITHM_EXECUTION_SUCCESS, algorithm.name, execution_time)
+    return ExecutionResult(
+        algorithm_name=algorithm.name,
+        success=True,
+        result=result,
+        execution_time=execution_time,
+    )
+
 
-def _report_progress(
-    callback: Optional[Callable[[str], None]], algo_name: str, status: str
-) -> None:
+def _pool_initializer(log_queue: Optional[Any], log_level: int) -> None:
     """
-    進捗をコールバックで報告
+    ワーカープロセスの初期化処理
+
+    最初のタスクを受け取る前にアルゴリズムモジュールを読み込み、
+    レジストリへの登録を済ませておくことで初回実行の遅延をなくします。
 
     Args:
-        callback: 進捗コールバック関数
-        algo_name: アルゴリズム名
-        status: ステータスメッセージ
+        log_queue: 親プロセスのログキュー（Noneの場合はロギングを変更しない）
+        log_level: ワーカーで使用するログレベル
     """
-    if callback:
-        callback(f"{algo_name}: {status}")
+    if log_queue is not None:
+        configure_worker_logging(log_queue, log_level)
+
+    # インポートの副作用でアルゴリズムが登録される
+    from .. import algorithms  # noqa: F401
 
 
 class ParallelExecutor:
     """並列実行エンジン"""
 
-    def __init__(self, max_workers: Optional[int] = None, use_processes: bool = False):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        mp_context: Optional[BaseContext] = None,
+    ):
         """
         Args:
             max_workers: 最大ワーカー数（Noneの場合は自動）
             use_processes: Trueの場合プロセスベース、Falseの場合スレッドベース
+            mp_context: ワーカープロセスの起動方式（Noneの場合はプラットフォームの既定）。
+                マルチスレッドのプロセスから使う場合はspawnなどforkを使わない方式を指定する
         """
         self.max_workers = max_workers
         self.use_processes = use_processes
+        self.mp_context = mp_context
 
     def execute_single(
         self, algorithm: BaseAlgorithm, master_file: str, student_file: str, **kwargs
@@ -104,32 +273,7 @@ class ParallelExecutor:
         Returns:
             ExecutionResult: 実行結果
         """
-        start_time = time.time()
-
-        try:
-            # ファイルの検証
-            algorithm.validate_files(master_file, student_file)
-
-            # アルゴリズムの実行
-            result = algorithm.execute(master_file, student_file, **kwargs)
-
-            execution_time = time.time() - start_time
-
-            return ExecutionResult(
-                algorithm_name=algorithm.name,
-                success=True,
-                result=result,
-                execution_time=execution_time,
-            )
-
-        except Exception as e:
-            execution_time = time.time() - start_time
-            return ExecutionResult(
-                algorithm_name=algorithm.name,
-                success=False,
-                error=str(e),
-                execution_time=execution_time,
-            )
+        return _run_one(algorithm, master_file, student_file, **kwargs)
 
     def execute_multiple(
         self,
@@ -154,45 +298,75 @@ class ParallelExecutor:
         """
         results = []
 
+        # 入力ファイルはすべてのアルゴリズムで共通のため、ここで一度だけ検証
+        file_error = BaseAlgorithm.check_files(master_file, student_file)
+
         # アルゴリズムを取得
         algorithms = []
-        for name in algorithm_names:
-            algo = AlgorithmRegistry.get_algorithm(name)
-            if algo is None:
+        for name, algorithm_class in _resolve_algorithm_classes(algorithm_names):
+            if algorithm_class is None:
                 results.append(ExecutionResult.create_algorithm_not_found(name))
+            elif file_error is not None:
+                results.append(ExecutionResult.create_file_validation_failed(name, file_error))
+                if progress_callback:
+                    progress_callback(f"{name}: 失敗")
             else:
-                algorithms.append(algo)
+                algorithms.append(algorithm_class())  # type: ignore[call-arg]
 
         if not algorithms:
             return results
 
         # 並列実行
-        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-
-        with executor_class(max_workers=self.max_workers) as executor:
-            # タスクを送信
-            future_to_algo = {
-                executor.submit(
-                    self.execute_single, algo, master_file, student_file, **kwargs
-                ): algo
-                for algo in algorithms
-            }
-
-            # 完了したタスクを処理
-            for future in as_completed(future_to_algo):
-                algo = future_to_algo[future]
-
-                try:
-                    result = future.result()
-                    results.append(result)
-                    status = "完了" if result.success else "失敗"
-                    _report_progress(progress_callback, algo.name, status)
-
-                except Exception as e:
-                    results.append(
-                        ExecutionResult(algorithm_name=algo.name, success=False, error=str(e))
+        executor: Executor
+        if self.use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_pool_initializer,
+                initargs=(get_log_queue(), get_logger("concept_map_system").getEffectiveLevel()),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # 同時に投入するタスク数の上限（入力のシリアライズが一度に集中しないようにする）
+        max_in_flight = 2 * (self.max_workers or os.cpu_count() or 1)
+        remaining = iter(algorithms)
+
+        with executor:
+            # 実行中のタスク（例外時の結果生成に必要なアルゴリズム名のみ保持する）
+            pending: Dict[Future, str] = {}
+
+            while True:
+                # 上限に達するまでタスクを逐次送信
+                for algo in islice(remaining, max_in_flight - len(pending)):
+                    future = executor.submit(
+                        _run_one, algo, master_file, student_file, skip_validation=True, **kwargs
                     )
-                    _report_progress(progress_callback, algo.name, f"エラー - {e!s}")
+                    pending[future] = algo.name
+
+                if not pending:
+                    break
+
+                # 完了したタスクを処理
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+
+                    try:
+                        result = future.result()
+                        results.append(result)
+                        if progress_callback:
+                            status = "完了" if result.success else "失敗"
+                            progress_callback(f"{result.algorithm_name}: {status}")
+
+                    except Exception as e:
+                        # ワーカーへの受け渡しなど、アルゴリズム外で発生したエラー
+                        error = _summarize_error(e)
+                        results.append(
+                            ExecutionResult(algorithm_name=name, success=False, error=error)
+                        )
+                        if progress_callback:
+                            progress_callback(f"{name}: エラー - {error}")
 
         return results
 
@@ -239,8 +413,7 @@ class SequentialExecutor:
         Returns:
             ExecutionResult: 実行結果
         """
-        executor = ParallelExecutor(max_workers=1)
-        return executor.execute_single(algorithm, master_file, student_file, **kwargs)
+        return _run_one(algorithm, master_file, student_file, **kwargs)
 
     def execute_multiple(
         self,
@@ -265,17 +438,27 @@ class SequentialExecutor:
         """
         results = []
 
-        for name in algorithm_names:
-            algo = AlgorithmRegistry.get_algorithm(name)
+        # 入力ファイルはすべてのアルゴリズムで共通のため、ここで一度だけ検証
+        file_error = BaseAlgorithm.check_files(master_file, student_file)
 
-            if algo is None:
+        for name, algorithm_class in _resolve_algorithm_classes(algorithm_names):
+            if algorithm_class is None:
                 results.append(ExecutionResult.create_algorithm_not_found(name))
-                _report_progress(progress_callback, name, "エラー - アルゴリズムが見つかりません")
+                if progress_callback:
+                    progress_callback(f"{name}: エラー - アルゴリズムが見つかりません")
+                continue
+
+            if file_error is not None:
+                results.append(ExecutionResult.create_file_validation_failed(name, file_error))
+                if progress_callback:
+                    progress_callback(f"{name}: 失敗")
                 continue
 
-            result = self.execute_single(algo, master_file, student_file, **kwargs)
+            algo = algorithm_class()  # type: ignore[call-arg]
+            result = _run_one(algo, master_file, student_file, skip_validation=True, **kwargs)
             results.append(result)
-            status = "完了" if result.success else "失敗"
-            _report_progress(progress_callback, algo.name, status)
+            if progress_callback:
+                status = "完了" if result.success else "失敗"
+                progress_callback(f"{algo.name}: {status}")
 
         return results
@@ -6,10 +6,66 @@
 プロジェクト全体で使用する統一されたロギング設定を提供します。
 """
 
+import atexit
 import logging
+import multiprocessing
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+
+class _QueueState:
+    """ファイル出力用のログキューとリスナーの保持先"""
+
+    log_queue: Optional[Any] = None
+    listener: Optional[QueueListener] = None
+
+
+# ファイル出力はキューにレコードを積むだけにし、実際の書き込みは親プロセスのリスナースレッドが担当する
+# （プロセスプールのワーカーからも同じキューに送れるようにmultiprocessingのキューを使用）
+_queue_state = _QueueState()
+
+# ログの書式
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 終了時にキューの残りレコードが書き出されるのを待つ上限（秒）
+_SHUTDOWN_DRAIN_TIMEOUT = 1.0
+
+
+def _stop_queue_listener() -> None:
+    """キューリスナーを停止（キューに残ったレコードはすべて書き出される）"""
+    listener = _queue_state.listener
+    if listener is None:
+        return
+    _queue_state.listener = None
+    try:
+        listener.stop()
+    except RuntimeError:
+        # 親プロセスが一度もキューへ書き込んでいない場合、終了処理中は送信スレッドを
+        # 起動できず停止用の番兵を送れない。ワーカーから届いたレコードが書き出されるまで待つ
+        deadline = time.monotonic() + _SHUTDOWN_DRAIN_TIMEOUT
+        while not listener.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+def _create_console_handler(level: int, formatter: logging.Formatter) -> logging.Handler:
+    """
+    標準出力へのコンソールハンドラーを作成
+
+    Args:
+        level: ログレベル
+        formatter: フォーマッター
+
+    Returns:
+        logging.Handler: コンソールハンドラー
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(formatter)
+    return console_handler
 
 
 def setup_logging(
@@ -39,22 +95,20 @@ def setup_logging(
     # ルートロガーを取得
     logger = logging.getLogger("concept_map_system")
     logger.setLevel(level)
+    logger.propagate = False
 
-    # 既存のハンドラーをクリア
+    # 既存のハンドラーとリスナーをクリア
+    _stop_queue_listener()
     logger.handlers.clear()
 
     # フォーマッターの設定
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    formatter = logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT)
 
-    # コンソールハンドラーの設定
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # コンソールハンドラーの設定（print出力と行が混ざらないよう同期的に出力）
+    logger.addHandler(_create_console_handler(level, formatter))
 
     # ファイルハンドラーの設定（指定された場合）
+    _queue_state.log_queue = None
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -62,8 +116,62 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
+        # ファイルハンドラーはリスナーが保持し、ロガーにはキューハンドラーのみを設定
+        # spawnコンテキストのキューはfork・spawnどちらで起動したワーカーにも渡せる
+        # （forkコンテキストのキューはspawnのワーカーに渡せない）
+        log_queue = multiprocessing.get_context("spawn").Queue(-1)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _queue_state.log_queue = log_queue
+        _queue_state.listener = listener
+        logger.addHandler(QueueHandler(log_queue))
+
+        # multiprocessingの終了処理がキューを閉じる前にリスナーを停止するため、キュー作成後に登録し直す
+        atexit.unregister(_stop_queue_listener)
+        atexit.register(_stop_queue_listener)
+
+    return logger
+
+
+def get_log_queue() -> Optional[Any]:
+    """
+    setup_loggingで作成されたログキューを取得
+
+    Returns:
+        Optional[Any]: ログキュー（ファイル出力が未設定の場合はNone）
+    """
+    return _queue_state.log_queue
+
+
+def configure_worker_logging(log_queue: Any, level: int = logging.INFO) -> logging.Logger:
+    """
+    ワーカープロセスのロギングを設定
+
+    ファイル出力用のレコードは親プロセスのキューへ送り、コンソールへは
+    親プロセスと同様にワーカーから直接出力します。forkで起動したワーカーは
+    親のコンソールハンドラーを引き継ぎ、spawnで起動したワーカーでは新たに作成します。
+
+    Args:
+        log_queue: get_log_queue()で取得した親プロセスのログキュー
+        level: ログレベル
+
+    Returns:
+        logging.Logger: 設定されたロガー
+    """
+    logger = logging.getLogger("concept_map_system")
+    logger.setLevel(level)
+    logger.propagate = False
+
+    # 親から引き継いだキューハンドラーのみを置き換え、コンソールハンドラーは残す
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    if not logger.handlers:
+        formatter = logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT)
+        logger.addHandler(_create_console_handler(level, formatter))
+
+    logger.addHandler(QueueHandler(log_queue))
     return logger
 
 
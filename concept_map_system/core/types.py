@@ -58,6 +58,8 @@ class ExpandedProposition(TypedDict):
 # ============================================================================
 # 採点結果型
 # ============================================================================
+# 採点結果はアルゴリズムの実行ごとに1つだけ生成され、フォーマッタやJSON出力が
+# ResultKeysをキーとする辞書として参照するため、dataclassではなくTypedDictで定義する
 
 
 class ScoringResult(TypedDict, total=False):
@@ -6,12 +6,13 @@
 すべてのアルゴリズムを統合したGUIインターフェース
 """
 
-import json
+import multiprocessing
+import queue
 import threading
 import tkinter as tk
-from pathlib import Path
+from functools import partial
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # アルゴリズムをインポート（自動登録）
 from .core import (
@@ -23,11 +24,46 @@ from .core import (
     get_logger,
     setup_logging,
 )
-from .utils import ResultFormatter
+from .core.constants import ResultKeys
+from .utils import ResultFormatter, save_json
 
 # ロガーの取得
 logger = get_logger(__name__)
 
+# UI更新キューを処理する間隔（ミリ秒）と1回あたりの最大処理件数
+UI_QUEUE_POLL_INTERVAL_MS = 30
+UI_QUEUE_BATCH_SIZE = 100
+
+# 結果一覧の列定義（列ID, 見出し, 幅, 配置）
+RESULT_TREE_COLUMNS = (
+    ("algorithm", "アルゴリズム", 160, tk.W),
+    ("status", "結果", 60, tk.CENTER),
+    ("precision", "適合率", 90, tk.E),
+    ("recall", "再現率", 90, tk.E),
+    ("f_value", "F値", 90, tk.E),
+    ("matched", "一致数", 80, tk.E),
+    ("time", "実行時間", 90, tk.E),
+)
+
+
+# 詳細表示用のフォーマッタ（セパレータは固定のため事前に束縛しておく）
+_format_result_detail = partial(
+    ResultFormatter.format_result_for_gui, separator=constants.SEPARATOR_EXTRA_LONG
+)
+
+
+def _format_metric(value: Any) -> str:
+    """
+    結果一覧に表示する評価指標をフォーマット
+
+    Args:
+        value: 評価指標の値
+
+    Returns:
+        str: 小数点以下3桁の文字列（数値でない場合は空文字列）
+    """
+    return f"{value:.3f}" if isinstance(value, (int, float)) else ""
+
 
 class ConceptMapSystemGUI:
     """概念マップ採点統合システムGUIアプリケーション"""
@@ -50,11 +86,21 @@ class ConceptMapSystemGUI:
         # 結果
         self.results: Dict[str, Any] = {}
 
+        # 結果一覧の行IDとフォーマット済みエントリの対応（詳細表示用）
+        self._result_entries: Dict[str, Dict[str, Any]] = {}
+        # 一度表示した詳細テキストのキャッシュ（行ID -> 表示文字列）
+        self._result_details: Dict[str, str] = {}
+
         # 実行中のスレッド
         self.running_thread: Optional[threading.Thread] = None
 
+        # ワーカースレッドからのUI更新要求（Tkはスレッドセーフではないため、
+        # ウィジェットの操作はすべてメインスレッドで行う）
+        self._ui_queue: queue.Queue[Tuple[str, Any]] = queue.Queue()
+
         self.setup_ui()
         self.load_algorithms()
+        self._drain_job = self.root.after(UI_QUEUE_POLL_INTERVAL_MS, self._drain_ui_queue)
 
         # ウィンドウクローズ時のクリーンアップを設定
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -144,9 +190,10 @@ class ConceptMapSystemGUI:
         button_frame = ttk.Frame(parent)
         button_frame.grid(row=4, column=0, columnspan=3, pady=10)
 
-        ttk.Button(
+        self.run_button = ttk.Button(
             button_frame, text="採点実行", command=self.run_scoring, style="Accent.TButton"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.run_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="結果をJSON保存", command=self.save_json).pack(
             side=tk.LEFT, padx=5
         )
@@ -160,12 +207,34 @@ class ConceptMapSystemGUI:
         result_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)  # type: ignore[arg-type]
         parent.rowconfigure(5, weight=1)
 
+        # 結果一覧（Treeviewは表示範囲外の行を描画しないため、件数が増えても軽量）
+        self.result_tree = ttk.Treeview(
+            result_frame,
+            columns=[column[0] for column in RESULT_TREE_COLUMNS],
+            show="headings",
+            height=6,
+        )
+        for column_id, heading, width, anchor in RESULT_TREE_COLUMNS:
+            self.result_tree.heading(column_id, text=heading)
+            self.result_tree.column(column_id, width=width, anchor=anchor)  # type: ignore[arg-type]
+        self.result_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))  # type: ignore[arg-type]
+        self.result_tree.bind("<<TreeviewSelect>>", self._on_result_selected)
+
+        tree_scrollbar = ttk.Scrollbar(
+            result_frame, orient=tk.VERTICAL, command=self.result_tree.yview
+        )
+        tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))  # type: ignore[arg-type]
+        self.result_tree.configure(yscrollcommand=tree_scrollbar.set)
+
+        # 進捗ログと、一覧で選択した結果の詳細
         self.result_text = scrolledtext.ScrolledText(
-            result_frame, wrap=tk.WORD, width=90, height=25
+            result_frame, wrap=tk.WORD, width=90, height=18
+        )
+        self.result_text.grid(
+            row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(5, 0)  # type: ignore[arg-type]
         )
-        self.result_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))  # type: ignore[arg-type]
         result_frame.columnconfigure(0, weight=1)
-        result_frame.rowconfigure(0, weight=1)
+        result_frame.rowconfigure(1, weight=1)
 
     def _setup_status_bar(self, parent: ttk.Frame) -> None:
         """ステータスバーとプログレスバーをセットアップ"""
@@ -185,13 +254,71 @@ class ConceptMapSystemGUI:
             log_msg: ログに記録するメッセージ
             exception: Trueの場合、例外のスタックトレースをログに記録
         """
-        self.progress.stop()
-        self.status_var.set(constants.STATUS_ERROR)
-        messagebox.showerror("エラー", error_msg)
         if exception:
             logger.exception(log_msg)
         else:
             logger.error(log_msg)
+        self._ui_queue.put(("error", error_msg))
+
+    def _drain_ui_queue(self) -> None:
+        """ワーカースレッドからのUI更新要求をメインスレッドで処理"""
+        lines: List[str] = []
+        try:
+            for _ in range(UI_QUEUE_BATCH_SIZE):
+                try:
+                    kind, payload = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if kind == "line":
+                    lines.append(f"{payload}\n")
+                    continue
+
+                # 順序を保つため、溜まった進捗メッセージを先に反映
+                self._insert_lines(lines)
+                if kind == "start":
+                    self.status_var.set(constants.STATUS_RUNNING)
+                    self.progress.start()
+                    self._clear_result_views()
+                elif kind == "done":
+                    self.run_button.state(["!disabled"])
+                    self._on_scoring_done(payload)
+                elif kind == "error":
+                    self._show_scoring_error(payload)
+
+            self._insert_lines(lines)
+        except Exception as e:
+            # 例外でポーリングが止まるとUIが応答しなくなるため、ここで捕捉して表示する
+            logger.exception("UI更新中に予期しないエラーが発生しました")
+            self._show_scoring_error(constants.ERROR_DURING_SCORING.format(str(e)))
+        finally:
+            self._drain_job = self.root.after(UI_QUEUE_POLL_INTERVAL_MS, self._drain_ui_queue)
+
+    def _show_scoring_error(self, error_msg: str) -> None:
+        """
+        採点をエラー状態で終了し、メッセージを表示
+
+        Args:
+            error_msg: ユーザーに表示するエラーメッセージ
+        """
+        self.run_button.state(["!disabled"])
+        self.progress.stop()
+        self.status_var.set(constants.STATUS_ERROR)
+        messagebox.showerror("エラー", error_msg)
+
+    def _insert_lines(self, lines: List[str]) -> None:
+        """
+        進捗メッセージを一度の挿入で表示に反映
+
+        Args:
+            lines: 改行付きのメッセージのリスト（反映後に空になる）
+        """
+        if not lines:
+            return
+
+        self.result_text.insert(tk.END, "".join(lines))
+        lines.clear()
+        self.result_text.see(tk.END)
 
     def load_algorithms(self) -> None:
         """登録されているアルゴリズムを読み込み"""
@@ -256,68 +383,96 @@ class ConceptMapSystemGUI:
             return
 
         # 既に実行中のスレッドがある場合は警告
-        if self.running_thread and self.running_thread.is_alive():
+        if self._is_running():
             messagebox.showwarning("警告", "既に採点が実行中です")
             logger.warning("採点が既に実行中です")
             return
 
+        # Tk変数はメインスレッドで読み取り、ワーカーには値だけを渡す
+        options = {"verbose": self.verbose.get(), "debug": self.debug.get()}
+
+        # 完了またはエラーの通知を受け取るまで、重複実行を防ぐためボタンを無効化
+        self.run_button.state(["disabled"])
+
         # スレッドで実行（daemon=Trueで、メインスレッド終了時に自動終了）
         self.running_thread = threading.Thread(
-            target=self._run_scoring_thread, args=(selected_algorithms,), daemon=True
+            target=self._run_scoring_thread,
+            args=(
+                selected_algorithms,
+                self.master_file.get(),
+                self.student_file.get(),
+                self.parallel.get(),
+                options,
+            ),
+            daemon=True,
         )
         self.running_thread.start()
 
-    def _run_scoring_thread(self, selected_algorithms: List[str]) -> None:
-        """採点をバックグラウンドで実行"""
+    def _is_running(self) -> bool:
+        """
+        採点が実行中かどうかを判定
+
+        Returns:
+            bool: 実行中のスレッドがある場合True
+        """
+        return self.running_thread is not None and self.running_thread.is_alive()
+
+    def _run_scoring_thread(
+        self,
+        selected_algorithms: List[str],
+        master_file: str,
+        student_file: str,
+        use_parallel: bool,
+        options: Dict[str, Any],
+    ) -> None:
+        """
+        採点をバックグラウンドで実行
+
+        ウィジェットには直接触れず、UI更新はすべてキュー経由でメインスレッドに依頼します。
+
+        Args:
+            selected_algorithms: 実行するアルゴリズム名のリスト
+            master_file: 模範解答ファイル
+            student_file: 生徒の回答ファイル
+            use_parallel: 並列実行するかどうか
+            options: アルゴリズムに渡すオプション
+        """
         # 防御的プログラミング: 空のアルゴリズムリストをチェック
         if not selected_algorithms:
-            logger.error("_run_scoring_threadが空のアルゴリズムリストで呼び出されました")
-            self.status_var.set(constants.STATUS_ERROR)
-            messagebox.showerror("エラー", "アルゴリズムが選択されていません")
+            self._handle_error(
+                "アルゴリズムが選択されていません",
+                "_run_scoring_threadが空のアルゴリズムリストで呼び出されました",
+            )
             return
 
         try:
-            self.status_var.set(constants.STATUS_RUNNING)
-            self.progress.start()
-            self.result_text.delete(1.0, tk.END)
-            self.root.update()
-            logger.info(f"採点を開始: {len(selected_algorithms)}個のアルゴリズム")
-
-            # 実行エンジンの選択
-            executor = ParallelExecutor() if self.parallel.get() else SequentialExecutor()
+            self._ui_queue.put(("start", None))
+            logger.info("採点を開始: %d個のアルゴリズム", len(selected_algorithms))
+
+            # 実行エンジンの選択（採点はCPU処理が中心のため、並列時はプロセスで実行）
+            # Tkのプロセスはマルチスレッドのため、forkではなくspawnでワーカーを起動する
+            executor = (
+                ParallelExecutor(
+                    use_processes=True, mp_context=multiprocessing.get_context("spawn")
+                )
+                if use_parallel
+                else SequentialExecutor()
+            )
 
-            # 進捗コールバック
+            # 進捗コールバック（表示への反映はメインスレッドでまとめて行う）
             def progress_callback(message: str) -> None:
-                self.result_text.insert(tk.END, f"{message}\n")
-                self.result_text.see(tk.END)
-                self.root.update()
-
-            # オプション
-            options = {"verbose": self.verbose.get(), "debug": self.debug.get()}
+                self._ui_queue.put(("line", message))
 
             # 実行
             results = executor.execute_multiple(
                 selected_algorithms,
-                self.master_file.get(),
-                self.student_file.get(),
+                master_file,
+                student_file,
                 progress_callback=progress_callback,
                 **options,
             )
 
-            # 結果を保存
-            self.results = {}
-            for result in results:
-                if result.success:
-                    self.results[result.algorithm_name] = result.result
-
-            # 結果を表示
-            self.display_results(results)
-
-            self.progress.stop()
-            self.status_var.set(constants.STATUS_COMPLETED)
-            success_msg = constants.SUCCESS_SCORING_COMPLETE.format(len(self.results), len(results))
-            messagebox.showinfo("完了", success_msg)
-            logger.info(f"採点が完了しました: 成功 {len(self.results)}/{len(results)}")
+            self._ui_queue.put(("done", results))
 
         except FileNotFoundError as e:
             error_msg = constants.ERROR_FILE_NOT_FOUND.format(str(e))
@@ -337,24 +492,97 @@ class ConceptMapSystemGUI:
             error_msg = constants.ERROR_DURING_SCORING.format(str(e))
             self._handle_error(error_msg, "採点中に予期しないエラーが発生しました", exception=True)
 
+    def _on_scoring_done(self, results: List[ExecutionResult]) -> None:
+        """
+        採点完了時の処理（メインスレッドで実行）
+
+        Args:
+            results: 実行結果のリスト
+        """
+        # 結果を保存
+        self.results = {}
+        for result in results:
+            if result.success:
+                self.results[result.algorithm_name] = result.result
+
+        # 結果を表示
+        self.display_results(results)
+
+        self.progress.stop()
+        self.status_var.set(constants.STATUS_COMPLETED)
+        success_msg = constants.SUCCESS_SCORING_COMPLETE.format(len(self.results), len(results))
+        messagebox.showinfo("完了", success_msg)
+        logger.info("採点が完了しました: 成功 %d/%d", len(self.results), len(results))
+
     def display_results(self, results: List[ExecutionResult]) -> None:
-        """結果を表示"""
-        self.result_text.insert(tk.END, "\n" + constants.SEPARATOR_EXTRA_LONG + "\n")
-        self.result_text.insert(tk.END, "採点結果サマリー\n")
-        self.result_text.insert(tk.END, constants.SEPARATOR_EXTRA_LONG + "\n\n")
+        """
+        結果を一覧に表示
+
+        詳細な出力は一覧で行を選択したときに表示します。
 
+        Args:
+            results: 実行結果のリスト
+        """
         # ResultFormatterを使用して結果を処理
         processed = ResultFormatter.process_results(results)
 
-        # 各結果を表示
-        for formatted_entry in processed["formatted_results"]:
-            gui_output = ResultFormatter.format_result_for_gui(
-                formatted_entry, constants.SEPARATOR_EXTRA_LONG
-            )
-            self.result_text.insert(tk.END, gui_output)
+        for result, formatted_entry in zip(results, processed["formatted_results"]):
+            row_id = self.result_tree.insert("", tk.END, values=self._build_result_row(result))
+            self._result_entries[row_id] = formatted_entry
 
+        summary = ResultFormatter.format_success_summary(
+            processed["success_count"], processed["total_count"]
+        )
+        self.result_text.insert(tk.END, f"\n{summary}（一覧で選択すると詳細を表示します）\n")
         self.result_text.see(tk.END)
 
+    @staticmethod
+    def _build_result_row(result: ExecutionResult) -> Tuple[str, ...]:
+        """
+        結果一覧の1行分の値を作成
+
+        Args:
+            result: 実行結果
+
+        Returns:
+            Tuple[str, ...]: RESULT_TREE_COLUMNSの順に並べた表示値
+        """
+        data = result.result if result.success and result.result else {}
+        matched = data.get(ResultKeys.MATCHED_COUNT, data.get(ResultKeys.MATCHED_PAIRS, ""))
+        return (
+            result.algorithm_name,
+            "成功" if result.success else "失敗",
+            _format_metric(data.get(ResultKeys.PRECISION)),
+            _format_metric(data.get(ResultKeys.RECALL)),
+            _format_metric(data.get(ResultKeys.F_VALUE)),
+            str(matched),
+            f"{result.execution_time:.2f}秒",
+        )
+
+    def _on_result_selected(self, _event: Any = None) -> None:
+        """一覧で選択された結果の詳細を表示"""
+        selection = self.result_tree.selection()
+        if not selection:
+            return
+
+        row_id = selection[0]
+        detail = self._result_details.get(row_id)
+        if detail is None:
+            formatted_entry = self._result_entries.get(row_id)
+            if formatted_entry is None:
+                return
+            detail = self._result_details[row_id] = _format_result_detail(formatted_entry)
+
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, detail)
+
+    def _clear_result_views(self) -> None:
+        """結果一覧と詳細表示をクリア"""
+        self.result_tree.delete(*self.result_tree.get_children())
+        self._result_entries.clear()
+        self._result_details.clear()
+        self.result_text.delete(1.0, tk.END)
+
     def save_json(self) -> None:
         """結果をJSON形式で保存"""
         if not self.results:
@@ -370,28 +598,26 @@ class ConceptMapSystemGUI:
 
         if filename:
             try:
-                output_path = Path(filename)
-                with output_path.open("w", encoding="utf-8") as f:
-                    json.dump(self.results, f, indent=2, ensure_ascii=False)
+                save_json(self.results, filename)
                 success_msg = constants.SUCCESS_FILE_SAVED.format(filename)
                 messagebox.showinfo("完了", success_msg)
-                logger.info(f"結果を保存しました: {filename}")
+                logger.info("結果を保存しました: %s", filename)
             except (OSError, IOError) as e:
                 error_msg = constants.ERROR_DURING_SAVE.format(str(e))
                 messagebox.showerror("エラー", error_msg)
-                logger.error(f"ファイル保存エラー: {filename} - {e!s}")
+                logger.error("ファイル保存エラー: %s - %s", filename, e)
             except (TypeError, ValueError) as e:
                 error_msg = constants.ERROR_DURING_SAVE.format(str(e))
                 messagebox.showerror("エラー", error_msg)
-                logger.error(f"JSON変換エラー: {e!s}")
+                logger.error("JSON変換エラー: %s", e)
             except Exception as e:
                 error_msg = constants.ERROR_DURING_SAVE.format(str(e))
                 messagebox.showerror("エラー", error_msg)
-                logger.exception(f"予期しないエラー (保存中): {filename}")
+                logger.exception("予期しないエラー (保存中): %s", filename)
 
     def clear_results(self) -> None:
         """結果をクリア"""
-        self.result_text.delete(1.0, tk.END)
+        self._clear_result_views()
         self.results = {}
         self.status_var.set(constants.STATUS_READY)
         logger.info("結果をクリアしました")
@@ -399,16 +625,18 @@ class ConceptMapSystemGUI:
     def _on_closing(self) -> None:
         """ウィンドウクローズ時のクリーンアップ処理"""
         # 実行中のスレッドがある場合は確認
-        if self.running_thread and self.running_thread.is_alive():
+        if self._is_running():
             if messagebox.askokcancel(
                 "確認", "採点が実行中です。終了してもよろしいですか？\n実行中の処理は中断されます。"
             ):
                 logger.info("ユーザーが実行中に終了を選択しました")
+                self.root.after_cancel(self._drain_job)
                 self.root.destroy()
             else:
                 logger.info("ユーザーが終了をキャンセルしました")
         else:
             logger.info("GUIアプリケーションを終了します")
+            self.root.after_cancel(self._drain_job)
             self.root.destroy()
 
 
@@ -0,0 +1,149 @@
+"""Tests for academic output formatters."""
+
+import shutil
+
+from concept_map_system.utils.academic_formatter import (
+    AcademicResultFormatter,
+    AcademicTableFormatter,
+    PreparedTable,
+    export_to_file,
+)
+
+HEADERS = ["Metric", "Value", "N"]
+ROWS = [["F", "0.500", 3], ["Precision", "0.250", 12]]
+
+
+class TestAcademicTableFormatter:
+    """Test cases for AcademicTableFormatter."""
+
+    def test_ascii_table(self):
+        """Test ASCII table layout and alignment."""
+        expected = "\n".join(
+            [
+                "┌───────────┬───────┬────┐",
+                "│   Metric  │ Value │ N  │",
+                "╞═══════════╪═══════╪════╡",
+                "│ F         │ 0.500 │  3 │",
+                "│ Precision │ 0.250 │ 12 │",
+                "└───────────┴───────┴────┘",
+            ]
+        )
+        assert AcademicTableFormatter.format_ascii_table(HEADERS, ROWS) == expected
+
+    def test_ascii_table_with_title(self):
+        """Test ASCII table title block."""
+        lines = AcademicTableFormatter.format_ascii_table(HEADERS, ROWS, title="T").split("\n")
+        assert lines[0] == "┌────────────────────────┐"
+        assert lines[1] == "│           T            │"
+        assert lines[2] == "├───────────┬───────┬────┤"
+
+    def test_ascii_table_short_row(self):
+        """Test that short rows are padded with empty cells."""
+        lines = AcademicTableFormatter.format_ascii_table(HEADERS, [["{x}"]]).split("\n")
+        assert lines[3] == "│ {x}    │       │   │"
+
+    def test_ascii_table_empty(self):
+        """Test that an empty table renders as an empty string."""
+        assert AcademicTableFormatter.format_ascii_table(HEADERS, []) == ""
+
+    def test_markdown_table(self):
+        """Test Markdown table layout and numeric alignment."""
+        expected = "\n".join(
+            [
+                "| Metric    | Value | N  |",
+                "| --------- | ----: | -: |",
+                "| F         | 0.500 | 3  |",
+                "| Precision | 0.250 | 12 |",
+            ]
+        )
+        assert AcademicTableFormatter.format_markdown_table(HEADERS, ROWS) == expected
+
+    def test_latex_table(self):
+        """Test LaTeX table structure."""
+        output = AcademicTableFormatter.format_latex_table(HEADERS, ROWS, caption="C", label="L")
+        assert "\\caption{C}" in output
+        assert "\\label{L}" in output
+        assert "\\begin{tabular}{|l|r|r|}" in output
+        assert "\\textbf{Metric} & \\textbf{Value} & \\textbf{N} \\\\" in output
+        assert "Precision & 0.250 & 12 \\\\" in output
+
+    def test_latex_escaping(self):
+        """Test that LaTeX special characters are escaped in headers and cells."""
+        output = AcademicTableFormatter.format_latex_table(
+            ["a_b", "100%"], [["x & y", "{#1}"], ["~^", "\\$"]]
+        )
+        assert "\\textbf{a\\_b} & \\textbf{100\\%} \\\\" in output
+        assert "x \\& y & \\{\\#1\\} \\\\" in output
+        assert "\\textasciitilde{}\\textasciicircum{} & \\textbackslash{}\\$ \\\\" in output
+
+    def test_prepared_table(self):
+        """Test that prepared tables render the same as raw rows."""
+        table = PreparedTable.from_rows(HEADERS, ROWS)
+        assert table.widths == (9, 5, 2)
+        assert table.numeric == (False, True, True)
+        formatter = AcademicTableFormatter
+        assert formatter.render_ascii_table(table) == formatter.format_ascii_table(HEADERS, ROWS)
+        assert formatter.render_markdown_table(table) == formatter.format_markdown_table(
+            HEADERS, ROWS
+        )
+        assert formatter.render_latex_table(table) == formatter.format_latex_table(HEADERS, ROWS)
+
+    def test_csv(self):
+        """Test CSV output."""
+        output = AcademicTableFormatter.format_csv(HEADERS, ROWS)
+        assert output == "Metric,Value,N\r\nF,0.500,3\r\nPrecision,0.250,12\r\n"
+
+
+RESULT = {
+    "method": "Test",
+    "total_score": 6,
+    "max_score": 9,
+    "percentage": 66.666,
+    "f_value": 0.5,
+    "precision": 0.4,
+    "recall": 0.6,
+    "total_props": 3,
+}
+
+
+class TestAcademicResultFormatter:
+    """Test cases for AcademicResultFormatter."""
+
+    def test_export_result_summary_csv(self, tmp_path):
+        """Test that streamed CSV export matches the formatted CSV summary."""
+        output = tmp_path / "out" / "summary.csv"
+        AcademicResultFormatter.export_result_summary_csv(RESULT, str(output))
+        with output.open(encoding="utf-8", newline="") as f:
+            written = f.read()
+        assert written == AcademicResultFormatter.format_result_summary(RESULT, "csv")
+        assert written.startswith("指標,値\r\n合計得点,6/9\r\n")
+
+    def test_comparison_table_csv(self):
+        """Test comparison rows, including missing metrics and skipped results."""
+        results = [
+            ("a", RESULT),
+            ("b", {"total_score": 1, "max_score": 2, "percentage": 50.0, "f_value": 0.0}),
+            ("c", {}),
+        ]
+        output = AcademicResultFormatter.format_comparison_table(results, "csv")
+        assert output.split("\r\n")[1:] == [
+            "a,6/9,66.7%,0.500,0.400,0.600",
+            "b,1/2,50.0%,0.000,N/A,N/A",
+            "",
+        ]
+
+    def test_render_all(self):
+        """Test that render_all matches per-format summaries."""
+        rendered = AcademicResultFormatter.render_all(RESULT)
+        assert list(rendered) == ["ascii", "latex", "markdown", "csv"]
+        for format_type, output in rendered.items():
+            assert output == AcademicResultFormatter.format_result_summary(RESULT, format_type)
+
+
+def test_export_to_file_recreates_deleted_directory(tmp_path):
+    """Test that exporting again after the output directory was removed succeeds."""
+    output_dir = tmp_path / "exports"
+    export_to_file("a", str(output_dir / "a.txt"))
+    shutil.rmtree(output_dir)
+    export_to_file("b", str(output_dir / "b.txt"))
+    assert (output_dir / "b.txt").read_text(encoding="utf-8") == "b"
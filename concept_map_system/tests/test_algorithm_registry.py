@@ -65,3 +65,22 @@ class TestAlgorithmRegistry:
         assert "description" in info
         assert "supported_options" in info
         assert isinstance(info["supported_options"], dict)
+
+    def test_get_algorithm_class(self):
+        """Test getting an algorithm class without instantiating it."""
+        assert AlgorithmRegistry.get_algorithm_class("test1") is DummyAlgorithm1
+        assert AlgorithmRegistry.get_algorithm_class("nonexistent") is None
+
+    def test_algorithm_info_is_cached(self, monkeypatch):
+        """Test that algorithm info is cached and invalidated on re-registration."""
+        first = AlgorithmRegistry.get_algorithm_info("test2")
+        first["description"] = "modified"
+
+        monkeypatch.setattr(AlgorithmRegistry, "get_algorithm", lambda _name: None)
+        cached = AlgorithmRegistry.get_algorithm_info("test2")
+        assert cached is not None
+        assert cached["description"] == "Test algorithm 2"
+
+        monkeypatch.undo()
+        AlgorithmRegistry.register(DummyAlgorithm2)
+        assert "test2" not in AlgorithmRegistry._info_cache
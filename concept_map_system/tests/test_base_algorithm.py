@@ -4,7 +4,7 @@ import tempfile
 
 import pytest
 
-from concept_map_system.core import BaseAlgorithm
+from concept_map_system.core import BaseAlgorithm, FileValidationError
 
 
 class DummyAlgorithm(BaseAlgorithm):
@@ -53,6 +53,15 @@ class TestBaseAlgorithm:
             with pytest.raises(FileNotFoundError, match="生徒の回答ファイルが見つかりません"):
                 algo.validate_files(master.name, "/nonexistent/student.csv")
 
+    def test_check_files_returns_error_without_raising(self):
+        """Test non-raising file check with missing files."""
+        with tempfile.NamedTemporaryFile(suffix=".csv") as master:
+            algo = DummyAlgorithm()
+            assert algo.check_files(master.name, master.name) is None
+            error = algo.check_files(master.name, "/nonexistent/student.csv")
+            assert isinstance(error, FileValidationError)
+            assert "生徒の回答ファイルが見つかりません" in str(error)
+
     def test_get_info(self):
         """Test getting algorithm info."""
         algo = DummyAlgorithm()
@@ -0,0 +1,61 @@
+"""Tests for CSV loading utilities."""
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from concept_map_system.core.exceptions import CSVLoadError
+from concept_map_system.utils.csv_loader import CSVLoader
+
+
+def write_csv(tmp_path, text):
+    """Write CSV text to a temporary file and return its path."""
+    path = tmp_path / "data.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+class TestCSVLoader:
+    """Test cases for CSVLoader."""
+
+    def test_rows_match_dict_reader(self, tmp_path):
+        """Test that rows are converted exactly like csv.DictReader."""
+        text = "id,antes,conq\n1,A,B\n\n2,C\n3,D,E,extra\n"
+        path = write_csv(tmp_path, text)
+        with Path(path).open(encoding="utf-8", newline="") as f:
+            expected = list(csv.DictReader(f))
+        assert CSVLoader.load_csv(path) == expected
+
+    def test_bom_and_filter(self, tmp_path):
+        """Test BOM handling and row filtering."""
+        path = tmp_path / "bom.csv"
+        path.write_text("id,antes,conq\n1,A,B\n2,,C\n", encoding="utf-8-sig")
+        data = CSVLoader.load_csv(str(path), row_filter=lambda row: bool(row["antes"]))
+        assert data == [{"id": "1", "antes": "A", "conq": "B"}]
+
+    def test_quoted_newline(self, tmp_path):
+        """Test that newlines inside quoted fields are preserved."""
+        path = tmp_path / "quoted.csv"
+        path.write_bytes(b'id,antes,conq\r\n1,"A\r\nB",C\r\n')
+        data = CSVLoader.load_csv(str(path))
+        assert data[0]["antes"] == "A\r\nB"
+
+    def test_missing_required_fields(self, tmp_path):
+        """Test that missing required columns raise CSVLoadError."""
+        path = write_csv(tmp_path, "id,antes\n1,A\n")
+        with pytest.raises(CSVLoadError, match="conq"):
+            CSVLoader.load_csv(path, required_fields=["id", "antes", "conq"])
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file raises CSVLoadError."""
+        path = write_csv(tmp_path, "")
+        with pytest.raises(CSVLoadError):
+            CSVLoader.load_csv(path)
+
+    def test_validator_error(self, tmp_path):
+        """Test that validator failures are reported with the row number."""
+        path = write_csv(tmp_path, "id,antes\n1,A\n,B\n")
+        validator = CSVLoader.create_field_validator(["id"])
+        with pytest.raises(CSVLoadError, match="行2"):
+            CSVLoader.load_csv(path, row_validator=validator)
@@ -0,0 +1,173 @@
+"""Tests for execution engines."""
+
+import multiprocessing
+import tempfile
+
+import pytest
+
+from concept_map_system.core import (
+    BaseAlgorithm,
+    ParallelExecutor,
+    SequentialExecutor,
+    register_algorithm,
+)
+
+
+@register_algorithm
+class ExecutorOkAlgorithm(BaseAlgorithm):
+    """Algorithm that always succeeds."""
+
+    def __init__(self):
+        super().__init__(name="exec_ok", description="Always succeeds")
+
+    def execute(self, master_file: str, student_file: str, **kwargs):
+        """Execute test algorithm."""
+        return {"method": "ExecOk", "options": kwargs}
+
+    def get_supported_options(self):
+        """Get supported options."""
+        return {}
+
+
+@register_algorithm
+class ExecutorFailAlgorithm(BaseAlgorithm):
+    """Algorithm that always raises."""
+
+    def __init__(self):
+        super().__init__(name="exec_fail", description="Always fails")
+
+    def execute(self, master_file: str, student_file: str, **kwargs):
+        """Execute test algorithm."""
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    def get_supported_options(self):
+        """Get supported options."""
+        return {}
+
+
+class ExecutorRaiseAlgorithm(BaseAlgorithm):
+    """Algorithm that raises the exception passed as an option."""
+
+    def __init__(self):
+        super().__init__(name="exec_raise", description="Raises the given error")
+
+    def execute(self, master_file: str, student_file: str, **kwargs):
+        """Execute test algorithm."""
+        raise kwargs["error"]
+
+    def get_supported_options(self):
+        """Get supported options."""
+        return {}
+
+
+@pytest.fixture
+def csv_files():
+    """Create temporary master/student files."""
+    with tempfile.NamedTemporaryFile(suffix=".csv") as master, tempfile.NamedTemporaryFile(
+        suffix=".csv"
+    ) as student:
+        yield master.name, student.name
+
+
+class TestParallelExecutor:
+    """Test cases for ParallelExecutor."""
+
+    def test_execute_single_success(self, csv_files):
+        """Test a successful run."""
+        result = ParallelExecutor().execute_single(ExecutorOkAlgorithm(), *csv_files, verbose=True)
+        assert result.success
+        assert result.result["options"] == {"verbose": True}
+        assert result.error is None
+        assert result.execution_time >= 0
+
+    def test_execute_single_missing_file(self, csv_files):
+        """Test a run with a missing input file."""
+        result = ParallelExecutor().execute_single(
+            ExecutorOkAlgorithm(), csv_files[0], "/nonexistent/student.csv"
+        )
+        assert not result.success
+        assert "生徒の回答ファイルが見つかりません" in result.error
+
+    def test_execute_single_algorithm_error(self, csv_files):
+        """Test a run whose algorithm raises."""
+        result = ParallelExecutor().execute_single(ExecutorFailAlgorithm(), *csv_files)
+        assert not result.success
+        assert result.error == "RuntimeError: boom"
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (
+                FileNotFoundError(2, "No such file or directory", "x.csv"),
+                "[Errno 2] No such file or directory: 'x.csv'",
+            ),
+            (
+                UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"),
+                "'utf-8' codec can't decode byte 0xff in position 0: invalid start byte",
+            ),
+        ],
+    )
+    def test_execute_single_expected_error_message(self, csv_files, error, expected):
+        """Test that expected errors keep their full message without a type prefix."""
+        result = ParallelExecutor().execute_single(ExecutorRaiseAlgorithm(), *csv_files, error=error)
+        assert not result.success
+        assert result.error == expected
+
+    def test_execute_multiple_bounded_submission(self, csv_files):
+        """Test that every algorithm is run even when more than the in-flight limit."""
+        names = ["exec_ok", "exec_fail", "missing"] * 5
+        messages = []
+        results = ParallelExecutor(max_workers=1).execute_multiple(
+            names, *csv_files, progress_callback=messages.append
+        )
+        assert len(results) == len(names)
+        assert sum(r.success for r in results) == 5
+        assert len(messages) == 10
+
+    def test_execute_multiple_missing_file(self, csv_files):
+        """Test that a missing input file fails every algorithm without running them."""
+        results = ParallelExecutor().execute_multiple(
+            ["exec_ok", "exec_fail"], "/nonexistent/master.csv", csv_files[1]
+        )
+        assert [r.success for r in results] == [False, False]
+        assert all("模範解答ファイルが見つかりません" in r.error for r in results)
+
+    def test_execute_multiple_with_processes(self, csv_files):
+        """Test process-based execution with the warmed worker pool."""
+        results = ParallelExecutor(max_workers=2, use_processes=True).execute_multiple(
+            ["exec_ok", "exec_fail"], *csv_files
+        )
+        assert sorted((r.algorithm_name, r.success) for r in results) == [
+            ("exec_fail", False),
+            ("exec_ok", True),
+        ]
+
+
+    def test_execute_multiple_with_spawn_context(self, csv_files):
+        """Test process-based execution with an explicit spawn start method."""
+        executor = ParallelExecutor(
+            max_workers=1, use_processes=True, mp_context=multiprocessing.get_context("spawn")
+        )
+        results = executor.execute_multiple(["exec_ok", "exec_fail"], *csv_files)
+        assert sorted((r.algorithm_name, r.success) for r in results) == [
+            ("exec_fail", False),
+            ("exec_ok", True),
+        ]
+
+
+class TestSequentialExecutor:
+    """Test cases for SequentialExecutor."""
+
+    def test_execute_multiple_preserves_order(self, csv_files):
+        """Test sequential execution order and missing algorithms."""
+        results = SequentialExecutor().execute_multiple(
+            ["exec_fail", "missing", "exec_ok"], *csv_files
+        )
+        assert [r.algorithm_name for r in results] == ["exec_fail", "missing", "exec_ok"]
+        assert [r.success for r in results] == [False, False, True]
+
+    def test_execute_multiple_skips_revalidation(self, csv_files):
+        """Test that algorithms are told the batch inputs were already validated."""
+        results = SequentialExecutor().execute_multiple(["exec_ok"], *csv_files)
+        assert results[0].result["options"] == {"validate": False}
@@ -30,6 +30,10 @@ class TestCreateSeparator:
         assert result == "-" * 40
         assert len(result) == 40
 
+    def test_separator_is_shared(self):
+        """同じ引数では同一の文字列を返す"""
+        assert create_separator("-", 40) is create_separator("-", 40)
+
     def test_different_lengths(self):
         """異なる長さのセパレーター生成"""
         assert len(create_separator("*", 10)) == 10
@@ -0,0 +1,24 @@
+"""Tests for JSON export utility."""
+
+import json
+
+from concept_map_system.utils import save_json
+
+
+class TestSaveJson:
+    """Test cases for save_json."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved data can be read back with the stdlib."""
+        data = {"method": "McClure", "percentage": 62.5, "results": [{"id": "1"}]}
+        path = tmp_path / "result.json"
+        save_json(data, str(path))
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+
+    def test_non_ascii_and_int_keys(self, tmp_path):
+        """Test unescaped Japanese text and integer keys."""
+        path = tmp_path / "result.json"
+        save_json({"名前": "完全一致", "score_counts": {3: 1, 0: 2}}, str(path))
+        text = path.read_text(encoding="utf-8")
+        assert "完全一致" in text
+        assert json.loads(text)["score_counts"] == {"3": 1, "0": 2}
@@ -0,0 +1,45 @@
+"""Tests for logging configuration."""
+
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+import pytest
+
+from concept_map_system.core.logging_config import (
+    configure_worker_logging,
+    get_log_queue,
+    setup_logging,
+)
+
+
+@pytest.fixture
+def package_logger():
+    """Yield the package logger and restore the default configuration afterwards."""
+    logger = logging.getLogger("concept_map_system")
+    yield logger
+    setup_logging()
+
+
+def _handler_types(logger):
+    return sorted(type(handler).__name__ for handler in logger.handlers)
+
+
+class TestConfigureWorkerLogging:
+    """Test cases for configure_worker_logging."""
+
+    def test_keeps_inherited_console_handler(self, package_logger, tmp_path):
+        """Test that a forked worker keeps console output and replaces the queue handler."""
+        setup_logging(log_file=str(tmp_path / "app.log"))
+        console = [h for h in package_logger.handlers if not isinstance(h, QueueHandler)]
+
+        configure_worker_logging(get_log_queue())
+
+        assert _handler_types(package_logger) == ["QueueHandler", "StreamHandler"]
+        assert console[0] in package_logger.handlers
+
+    def test_adds_console_handler_when_none(self, package_logger):
+        """Test that a spawned worker without handlers gets a console handler."""
+        package_logger.handlers.clear()
+        configure_worker_logging(queue.Queue())
+        assert _handler_types(package_logger) == ["QueueHandler", "StreamHandler"]
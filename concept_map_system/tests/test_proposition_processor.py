@@ -0,0 +1,53 @@
+"""Tests for proposition processing utilities."""
+
+from concept_map_system.utils.proposition_processor import decompose_qualifiers
+
+
+class TestDecomposeQualifiers:
+    """Test cases for decompose_qualifiers."""
+
+    def test_multi_antes_is_decomposed(self):
+        """Test that a multi-node antes yields a main link and qualifier links."""
+        result = decompose_qualifiers([{"id": "1", "antes": "0 1 2", "conq": "3", "type": "If"}])
+        assert result == [
+            {
+                "id": "1_main",
+                "antes": "0",
+                "conq": "3",
+                "type": "If",
+                "original_id": "1",
+                "is_decomposed": True,
+            },
+            {
+                "id": "1_q_1",
+                "antes": "0",
+                "conq": "1",
+                "type": "Qualifier",
+                "original_id": "1",
+                "is_decomposed": True,
+            },
+            {
+                "id": "1_q_2",
+                "antes": "0",
+                "conq": "2",
+                "type": "Qualifier",
+                "original_id": "1",
+                "is_decomposed": True,
+            },
+        ]
+
+    def test_single_antes_is_copied(self):
+        """Test that single-node propositions are returned as copies."""
+        prop = {"id": "2", "antes": "A", "conq": "B", "type": "Because"}
+        result = decompose_qualifiers([prop])
+        assert result == [prop]
+        assert result[0] is not prop
+
+    def test_empty_nodes_are_skipped(self):
+        """Test that propositions with empty antes or conq are dropped."""
+        props = [
+            {"id": "3", "antes": " ", "conq": "B", "type": "If"},
+            {"id": "4", "antes": "A", "conq": "", "type": "If"},
+            {"id": "5", "antes": "A", "type": "If"},
+        ]
+        assert decompose_qualifiers(props) == []
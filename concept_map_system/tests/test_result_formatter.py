@@ -0,0 +1,76 @@
+"""Tests for ResultFormatter."""
+
+from concept_map_system.core import AlgorithmRegistry, BaseAlgorithm, ExecutionResult
+from concept_map_system.utils.result_formatter import ResultFormatter
+
+
+def _make_algorithm(label):
+    """Create an algorithm class whose formatted output is the given label."""
+
+    class FormatterTestAlgorithm(BaseAlgorithm):
+        instances = 0
+
+        def __init__(self):
+            super().__init__(name="formatter_test", description="Formatter test")
+            type(self).instances += 1
+
+        def execute(self, master_file, student_file, **kwargs):
+            return {}
+
+        def get_supported_options(self):
+            return {}
+
+        def format_results(self, results):
+            return label
+
+    return FormatterTestAlgorithm
+
+
+class TestProcessResults:
+    """Test cases for ResultFormatter.process_results."""
+
+    def test_counts_and_collects_results(self):
+        """Test success counting and collection of non-empty results."""
+        results = [
+            ExecutionResult("a", True, {"total_score": 1}, execution_time=0.1),
+            ExecutionResult("b", False, error="boom"),
+            ExecutionResult("c", True, {}, execution_time=0.2),
+        ]
+        processed = ResultFormatter.process_results(results)
+        assert processed["success_count"] == 2
+        assert processed["total_count"] == 3
+        assert processed["all_results"] == {"a": {"total_score": 1}}
+        assert [e["algorithm_name"] for e in processed["formatted_results"]] == ["a", "b", "c"]
+        assert processed["formatted_results"][1]["error"] == "boom"
+
+    def test_empty(self):
+        """Test processing an empty result list."""
+        processed = ResultFormatter.process_results([])
+        assert processed == {
+            "success_count": 0,
+            "total_count": 0,
+            "formatted_results": [],
+            "all_results": {},
+        }
+
+
+class TestFormatSingleResult:
+    """Test cases for ResultFormatter._format_single_result."""
+
+    def test_algorithm_instance_is_reused_per_class(self):
+        """Test that formatting reuses instances and follows re-registration."""
+        result = ExecutionResult("formatter_test", True, {"total_score": 1})
+        first = _make_algorithm("first")
+        second = _make_algorithm("second")
+        try:
+            AlgorithmRegistry.register(first)
+            outputs = [ResultFormatter._format_single_result(result) for _ in range(3)]
+            assert [e["formatted_output"] for e in outputs] == ["first"] * 3
+            # One instance at registration, one shared for formatting
+            assert first.instances == 2
+
+            AlgorithmRegistry.register(second)
+            entry = ResultFormatter._format_single_result(result)
+            assert entry["formatted_output"] == "second"
+        finally:
+            AlgorithmRegistry.unregister("formatter_test")
@@ -0,0 +1,45 @@
+"""Tests for the utils package exports."""
+
+import pytest
+
+from concept_map_system import utils
+
+EXPECTED_EXPORTS = {
+    "AcademicResultFormatter",
+    "AcademicTableFormatter",
+    "CSVLoader",
+    "ResultFormatter",
+    "create_separator",
+    "create_title_block",
+    "decompose_qualifiers",
+    "export_csv_to_file",
+    "export_to_file",
+    "format_f_metrics",
+    "format_score_display",
+    "join_output",
+    "save_json",
+    "validate_link_type",
+    "validate_node_ids",
+    "validate_proposition_data",
+    "validate_proposition_fields",
+    "validate_propositions_list",
+}
+
+
+class TestUtilsPackage:
+    """Test cases for concept_map_system.utils."""
+
+    def test_all_exports(self):
+        """Test that __all__ matches the expected public symbols."""
+        assert set(utils.__all__) == EXPECTED_EXPORTS
+        assert len(utils.__all__) == len(EXPECTED_EXPORTS)
+
+    @pytest.mark.parametrize("name", sorted(EXPECTED_EXPORTS))
+    def test_exports_resolve(self, name):
+        """Test that every exported symbol can be loaded."""
+        assert getattr(utils, name) is not None
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            utils.nonexistent_symbol  # noqa: B018
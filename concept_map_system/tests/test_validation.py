@@ -0,0 +1,126 @@
+"""Tests for data validation utilities."""
+
+import pytest
+
+from concept_map_system.core.exceptions import FileValidationError, ValidationError
+from concept_map_system.utils.validation import (
+    _normalize_allowed_types,
+    validate_link_type,
+    validate_node_ids,
+    validate_proposition_data,
+    validate_proposition_fields,
+    validate_propositions_list,
+)
+
+
+class TestValidatePropositionData:
+    """Test cases for validate_proposition_data and validate_proposition_fields."""
+
+    def test_valid(self):
+        """Test that a complete proposition passes."""
+        validate_proposition_data({"id": "1", "antes": "A B", "conq": "C"})
+
+    def test_non_string_values(self):
+        """Test that non-string values are normalized with str()."""
+        validate_proposition_data({"id": 1, "antes": 2, "conq": 3})  # type: ignore[typeddict-item]
+
+    @pytest.mark.parametrize(
+        ("prop", "message"),
+        [
+            ({"id": " ", "antes": "A", "conq": "B"}, "IDが空です"),
+            ({"id": "1", "antes": "\t", "conq": "B"}, "antesノードが空です"),
+            ({"id": "1", "antes": "A", "conq": "  "}, "conqノードが空です"),
+            ({"id": "1", "antes": "A"}, "必須フィールドが不足しています"),
+            ({"id": "1", "antes": "", "conq": "B"}, "必須フィールドが不足しています"),
+        ],
+    )
+    def test_invalid(self, prop, message):
+        """Test the error raised for each kind of invalid proposition."""
+        with pytest.raises(ValidationError, match=message):
+            validate_proposition_data(prop)
+
+    def test_unhashable_values(self):
+        """Test that unhashable field values are validated."""
+        prop = {"id": "1", "antes": ["A"], "conq": "B"}
+        validate_proposition_data(prop)  # type: ignore[arg-type]
+
+    def test_missing_fields_are_listed(self):
+        """Test that every missing field is reported."""
+        with pytest.raises(ValidationError, match=r"\['antes', 'conq'\]"):
+            validate_proposition_fields({"id": "1", "antes": None})
+
+    def test_error_message_is_formatted(self):
+        """Test that the raised error carries the fully formatted message."""
+        prop = {"id": "1", "antes": "A", "conq": " "}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_proposition_data(prop)
+        assert exc_info.value.args == (f"conqノードが空です: {prop}",)
+
+    def test_multi_argument_errors_are_plain_exceptions(self):
+        """Test that extra exception arguments are not treated as a format template."""
+        error = FileValidationError("missing file", "/data/100%.csv")
+        assert str(error) == "('missing file', '/data/100%.csv')"
+
+    def test_custom_required_fields(self):
+        """Test validation against a custom field list."""
+        validate_proposition_fields({"type": "If"}, ["type"])
+        with pytest.raises(ValidationError):
+            validate_proposition_fields({"type": ""}, ["type"])
+
+
+class TestValidateNodeIdsAndLinkType:
+    """Test cases for validate_node_ids and validate_link_type."""
+
+    @pytest.mark.parametrize(
+        ("node_ids", "expected"), [("A B C", True), ("A", True), ("", False), ("   ", False)]
+    )
+    def test_validate_node_ids(self, node_ids, expected):
+        """Test node ID string validation."""
+        assert validate_node_ids(node_ids) is expected
+
+    @pytest.mark.parametrize(
+        ("link_type", "allowed", "expected"),
+        [
+            ("causes", None, True),
+            ("", None, False),
+            ("causes", ["causes", "leads_to"], True),
+            (" CAUSES ", ["causes", "leads_to"], True),
+            ("causes", [" Causes "], True),
+            ("unknown", ["causes", "leads_to"], False),
+        ],
+    )
+    def test_validate_link_type(self, link_type, allowed, expected):
+        """Test case-insensitive link type validation."""
+        assert validate_link_type(link_type, allowed) is expected
+
+    def test_allowed_types_are_normalized_once(self):
+        """Test that the normalized allow-list is reused across calls."""
+        allowed = ["Causes", "Leads_To"]
+        _normalize_allowed_types.cache_clear()
+        assert validate_link_type("causes", allowed)
+        assert validate_link_type("LEADS_TO", allowed)
+        assert _normalize_allowed_types.cache_info().misses == 1
+
+
+class TestValidatePropositionsList:
+    """Test cases for validate_propositions_list."""
+
+    PROPS = (
+        {"id": "1", "antes": "A", "conq": "B"},
+        {"id": "2", "antes": " ", "conq": "B"},
+        {"antes": "A", "conq": "B"},
+        {"id": 4, "antes": "A", "conq": ""},
+    )
+
+    def test_collects_invalid_ids(self):
+        """Test that invalid proposition IDs are collected as strings."""
+        assert validate_propositions_list(list(self.PROPS)) == ["2", "N/A", "4"]
+
+    def test_strict_raises_first_error(self):
+        """Test that strict mode raises on the first invalid proposition."""
+        with pytest.raises(ValidationError, match="antesノードが空です"):
+            validate_propositions_list(list(self.PROPS), strict=True)
+
+    def test_empty(self):
+        """Test that an empty list is valid."""
+        assert validate_propositions_list([]) == []
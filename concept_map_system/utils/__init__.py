@@ -3,30 +3,60 @@
 """
 ユーティリティモジュール
 共通のヘルパー関数とユーティリティを提供します。
+
+各シンボルは初めて参照されたときに定義元のモジュールから読み込まれます（PEP 562）。
 """
 
-from .academic_formatter import (
-    AcademicResultFormatter,
-    AcademicTableFormatter,
-    export_to_file,
-)
-from .csv_loader import CSVLoader
-from .formatting import (
-    create_separator,
-    create_title_block,
-    format_f_metrics,
-    format_score_display,
-    join_output,
-)
-from .proposition_processor import decompose_qualifiers
-from .result_formatter import ResultFormatter
-from .validation import (
-    validate_link_type,
-    validate_node_ids,
-    validate_proposition_data,
-    validate_proposition_fields,
-    validate_propositions_list,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .academic_formatter import (
+        AcademicResultFormatter,
+        AcademicTableFormatter,
+        export_csv_to_file,
+        export_to_file,
+    )
+    from .csv_loader import CSVLoader
+    from .formatting import (
+        create_separator,
+        create_title_block,
+        format_f_metrics,
+        format_score_display,
+        join_output,
+    )
+    from .json_export import save_json
+    from .proposition_processor import decompose_qualifiers
+    from .result_formatter import ResultFormatter
+    from .validation import (
+        validate_link_type,
+        validate_node_ids,
+        validate_proposition_data,
+        validate_proposition_fields,
+        validate_propositions_list,
+    )
+
+# シンボル名と定義元モジュールの対応
+_LAZY_IMPORTS: Dict[str, str] = {
+    "AcademicResultFormatter": "academic_formatter",
+    "AcademicTableFormatter": "academic_formatter",
+    "export_csv_to_file": "academic_formatter",
+    "export_to_file": "academic_formatter",
+    "CSVLoader": "csv_loader",
+    "create_separator": "formatting",
+    "create_title_block": "formatting",
+    "format_f_metrics": "formatting",
+    "format_score_display": "formatting",
+    "join_output": "formatting",
+    "save_json": "json_export",
+    "decompose_qualifiers": "proposition_processor",
+    "ResultFormatter": "result_formatter",
+    "validate_link_type": "validation",
+    "validate_node_ids": "validation",
+    "validate_proposition_data": "validation",
+    "validate_proposition_fields": "validation",
+    "validate_propositions_list": "validation",
+}
 
 __all__ = [
     "AcademicResultFormatter",
@@ -36,13 +66,44 @@ __all__ = [
     "create_separator",
     "create_title_block",
     "decompose_qualifiers",
+    "export_csv_to_file",
     "export_to_file",
     "format_f_metrics",
     "format_score_display",
     "join_output",
+    "save_json",
     "validate_link_type",
     "validate_node_ids",
     "validate_proposition_data",
     "validate_proposition_fields",
     "validate_propositions_list",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    シンボルを初回参照時に読み込む
+
+    Args:
+        name: シンボル名
+
+    Returns:
+        Any: 読み込んだシンボル
+
+    Raises:
+        AttributeError: 存在しないシンボルの場合
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # 2回目以降は通常の属性として参照されるようにキャッシュする
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """モジュールの属性一覧を返す（遅延読み込みのシンボルを含む）"""
+    return sorted(set(globals()) | set(__all__))
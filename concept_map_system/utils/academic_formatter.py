@@ -6,13 +6,182 @@
 論文掲載用の高品質な表とレポートを生成するユーティリティ
 """
 
+import csv
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from io import StringIO
+from itertools import chain, repeat, zip_longest
+from pathlib import Path
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+from ..core import constants
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# 配置指定とstr.formatの書式指定子の対応
+_ALIGN_SPECS = {"left": "<", "right": ">", "center": "^"}
+
+# 比較表の評価指標列（F値、適合率、再現率の順）
+_COMPARISON_METRIC_KEYS = ("f_value", "precision", "recall")
+
+# LaTeXの特殊文字とエスケープ後の表記（1回の正規表現置換でまとめて処理する）
+_LATEX_ESCAPES = {
+    "&": "\\&",
+    "%": "\\%",
+    "$": "\\$",
+    "#": "\\#",
+    "_": "\\_",
+    "{": "\\{",
+    "}": "\\}",
+    "~": "\\textasciitilde{}",
+    "^": "\\textasciicircum{}",
+    "\\": "\\textbackslash{}",
+}
+_LATEX_SPECIAL_CHARS = re.compile(r"[&%$#_{}~^\\]")
+
+
+def _stringify_rows(rows: List[List[Any]]) -> List[List[str]]:
+    """
+    表の各セルを文字列に変換（各セルにつき一度だけ変換する）
+
+    Args:
+        rows: データ行のリスト
+
+    Returns:
+        文字列に変換したデータ行のリスト
+    """
+    return [[cell if type(cell) is str else str(cell) for cell in row] for row in rows]
+
+
+def _column_widths(headers: List[str], str_rows: List[List[str]]) -> List[int]:
+    """
+    各列の最大幅を計算
+
+    列ごとにまとめてlen/maxを適用し、セル単位のPythonループを避けます。
+    ヘッダーより列数の多い行の余分なセルは無視します。
+
+    Args:
+        headers: ヘッダー行
+        str_rows: 文字列に変換済みのデータ行のリスト
+
+    Returns:
+        各列の幅のリスト
+    """
+    # 行の列数がヘッダーより少ない場合は、残りの列をヘッダー幅のみで計算
+    columns = chain(zip_longest(*str_rows, fillvalue=""), repeat(()))
+    return [
+        max(len(header), max(map(len, column), default=0))
+        for header, column in zip(headers, columns)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _numeric_columns(column_count: int, first_row: Tuple[str, ...]) -> Tuple[bool, ...]:
+    """
+    最初のデータ行から各列が数値列かどうかを判定
+
+    同じ表を複数の形式で出力する場合に判定をやり直さないよう、結果をキャッシュします。
+
+    Args:
+        column_count: 列数（ヘッダーの数）
+        first_row: 文字列に変換済みの最初のデータ行
+
+    Returns:
+        各列が数値列ならTrueのタプル（最初の行に存在しない列はFalse）
+    """
+    numeric = []
+    for i in range(column_count):
+        if i < len(first_row):
+            try:
+                float(first_row[i])
+                numeric.append(True)
+                continue
+            except ValueError:
+                pass
+        numeric.append(False)
+    return tuple(numeric)
+
+
+def _first_row_numeric_columns(headers: List[str], str_rows: List[List[str]]) -> Tuple[bool, ...]:
+    """
+    _numeric_columnsをリスト形式の表データから呼び出す
+
+    Args:
+        headers: ヘッダー行
+        str_rows: 文字列に変換済みのデータ行のリスト
+
+    Returns:
+        各列が数値列ならTrueのタプル
+    """
+    return _numeric_columns(len(headers), tuple(str_rows[0]) if str_rows else ())
+
+
+def _escape_latex(text: str) -> str:
+    """
+    LaTeXの特殊文字をエスケープ
+
+    Args:
+        text: エスケープ対象の文字列
+
+    Returns:
+        エスケープ済みの文字列
+    """
+    return _LATEX_SPECIAL_CHARS.sub(lambda m: _LATEX_ESCAPES[m.group()], text)
+
+
+@lru_cache(maxsize=128)
+def _ascii_borders(col_widths: Tuple[int, ...]) -> Tuple[str, str, str, str]:
+    """
+    ASCII表の罫線を作成（同じ列幅の組み合わせでは再利用する）
+
+    Args:
+        col_widths: 各列の幅
+
+    Returns:
+        (上罫線, タイトル下の罫線, ヘッダー下の罫線, 下罫線) のタプル
+    """
+    top_line = "┌" + "┬".join("─" * (w + 2) for w in col_widths) + "┐"
+    title_line = "├" + "┬".join("─" * (w + 2) for w in col_widths) + "┤"
+    header_line = "╞" + "╪".join("═" * (w + 2) for w in col_widths) + "╡"
+    bottom_line = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
+    return top_line, title_line, header_line, bottom_line
+
+
+class PreparedTable(NamedTuple):
+    """
+    文字列化・列幅計算済みの表データ
+
+    同じ表を複数の形式で出力する場合に、セルの文字列化と列幅・数値列の判定を
+    一度だけ行うために使用します。
+    """
+
+    headers: List[str]
+    rows: List[List[str]]
+    widths: Tuple[int, ...]
+    numeric: Tuple[bool, ...]
+
+    @classmethod
+    def from_rows(cls, headers: List[str], rows: List[List[Any]]) -> "PreparedTable":
+        """
+        生の表データからPreparedTableを構築
+
+        Args:
+            headers: ヘッダー行
+            rows: データ行のリスト
+
+        Returns:
+            構築したPreparedTable
+        """
+        str_rows = _stringify_rows(rows)
+        return cls(
+            headers,
+            str_rows,
+            tuple(_column_widths(headers, str_rows)),
+            _first_row_numeric_columns(headers, str_rows),
+        )
+
 
 class AcademicTableFormatter:
     """論文品質の表フォーマッター"""
@@ -36,48 +205,48 @@ class AcademicTableFormatter:
         Returns:
             フォーマット済みの表文字列
         """
-        if not rows:
+        return AcademicTableFormatter.render_ascii_table(
+            PreparedTable.from_rows(headers, rows), title=title, align=align
+        )
+
+    @staticmethod
+    def render_ascii_table(
+        table: PreparedTable,
+        title: Optional[str] = None,
+        align: Optional[List[str]] = None,
+    ) -> str:
+        """
+        構築済みの表データからASCII罫線を使った表を生成
+
+        Args:
+            table: 構築済みの表データ
+            title: 表のタイトル（オプション）
+            align: 各列の配置 ('left', 'center', 'right')
+
+        Returns:
+            フォーマット済みの表文字列
+        """
+        headers, str_rows, col_widths, numeric_columns = table
+        if not str_rows:
             return ""
 
-        # デフォルトの配置（数値は右寄せ、それ以外は左寄せ）
+        # デフォルトの配置（最初の行で数値の列は右寄せ、それ以外は左寄せ）
         if align is None:
-            align = []
-            for i, header in enumerate(headers):
-                # 最初の列サンプルで判定
-                if rows and i < len(rows[0]):
-                    try:
-                        float(rows[0][i])
-                        align.append("right")
-                    except (ValueError, TypeError):
-                        align.append("left")
-                else:
-                    align.append("left")
-
-        # 各列の最大幅を計算
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(str(cell)))
+            align = ["right" if numeric else "left" for numeric in numeric_columns]
 
         # 罫線文字
-        top_line = "┌" + "┬".join("─" * (w + 2) for w in col_widths) + "┐"
-        mid_line = "├" + "┼".join("─" * (w + 2) for w in col_widths) + "┤"
-        bottom_line = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
-        header_line = "╞" + "╪".join("═" * (w + 2) for w in col_widths) + "╡"
-
-        def format_row(cells: List[str], widths: List[int], alignments: List[str]) -> str:
-            """行をフォーマット"""
-            formatted = []
-            for cell, width, align_type in zip(cells, widths, alignments):
-                cell_str = str(cell)
-                if align_type == "right":
-                    formatted.append(cell_str.rjust(width))
-                elif align_type == "center":
-                    formatted.append(cell_str.center(width))
-                else:
-                    formatted.append(cell_str.ljust(width))
-            return "│ " + " │ ".join(formatted) + " │"
+        top_line, title_line, header_line, bottom_line = _ascii_borders(col_widths)
+
+        # データ行の書式テンプレート（列幅と配置から一度だけ構築し、各行は1回のformatで出力）
+        row_template = (
+            "│ "
+            + " │ ".join(
+                f"{{:{_ALIGN_SPECS.get(align_type, '<')}{width}}}"
+                for width, align_type in zip(col_widths, chain(align, repeat("left")))
+            )
+            + " │"
+        )
+        column_count = len(col_widths)
 
         # 表を構築
         lines = []
@@ -87,20 +256,20 @@ class AcademicTableFormatter:
             total_width = sum(col_widths) + len(col_widths) * 3 + 1
             lines.append("┌" + "─" * (total_width - 2) + "┐")
             lines.append("│ " + title.center(total_width - 4) + " │")
-            lines.append("├" + "┬".join("─" * (w + 2) for w in col_widths) + "┤")
+            lines.append(title_line)
         else:
             lines.append(top_line)
 
         # ヘッダー
-        lines.append(format_row(headers, col_widths, ["center"] * len(headers)))
+        lines.append(
+            "│ " + " │ ".join(h.center(w) for h, w in zip(headers, col_widths)) + " │"
+        )
         lines.append(header_line)
 
-        # データ行
-        for i, row in enumerate(rows):
-            lines.append(format_row(row, col_widths, align))
-            if i < len(rows) - 1:
-                # 最後の行以外は区切り線を追加しない（オプション）
-                pass
+        # データ行（列数が足りない行は空セルで補う）
+        for row in str_rows:
+            padded = row + [""] * (column_count - len(row)) if len(row) < column_count else row
+            lines.append(row_template.format(*padded))
 
         lines.append(bottom_line)
 
@@ -125,21 +294,34 @@ class AcademicTableFormatter:
         Returns:
             LaTeX形式の表文字列
         """
-        # 列の配置（最初の列は左、数値列は右）
-        alignments = []
-        for i, header in enumerate(headers):
-            if i == 0:
-                alignments.append("l")
-            else:
-                # 数値かどうかチェック
-                try:
-                    if rows and i < len(rows[0]):
-                        float(rows[0][i])
-                        alignments.append("r")
-                    else:
-                        alignments.append("c")
-                except (ValueError, TypeError):
-                    alignments.append("c")
+        return AcademicTableFormatter.render_latex_table(
+            PreparedTable.from_rows(headers, rows), caption=caption, label=label
+        )
+
+    @staticmethod
+    def render_latex_table(
+        table: PreparedTable,
+        caption: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> str:
+        """
+        構築済みの表データからLaTeX形式の表を生成
+
+        Args:
+            table: 構築済みの表データ
+            caption: 表のキャプション
+            label: LaTeXラベル
+
+        Returns:
+            LaTeX形式の表文字列
+        """
+        headers, str_rows = table.headers, table.rows
+
+        # 列の配置（最初の列は左、数値列は右、それ以外は中央）
+        alignments = [
+            "l" if i == 0 else ("r" if numeric else "c")
+            for i, numeric in enumerate(table.numeric)
+        ]
 
         col_spec = "|" + "|".join(alignments) + "|"
 
@@ -158,13 +340,13 @@ class AcademicTableFormatter:
             [
                 f"  \\begin{{tabular}}{{{col_spec}}}",
                 "    \\hline",
-                f"    {' & '.join(f'\\textbf{{{h}}}' for h in headers)} \\\\",
+                "    " + " & ".join(f"\\textbf{{{_escape_latex(h)}}}" for h in headers) + " \\\\",
                 "    \\hline",
             ]
         )
 
-        for row in rows:
-            lines.append(f"    {' & '.join(str(cell) for cell in row)} \\\\")
+        for row in str_rows:
+            lines.append("    " + " & ".join(map(_escape_latex, row)) + " \\\\")
 
         lines.extend(
             [
@@ -188,12 +370,20 @@ class AcademicTableFormatter:
         Returns:
             Markdown形式の表文字列
         """
-        # 各列の最大幅を計算
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(str(cell)))
+        return AcademicTableFormatter.render_markdown_table(PreparedTable.from_rows(headers, rows))
+
+    @staticmethod
+    def render_markdown_table(table: PreparedTable) -> str:
+        """
+        構築済みの表データからMarkdown形式の表を生成
+
+        Args:
+            table: 構築済みの表データ
+
+        Returns:
+            Markdown形式の表文字列
+        """
+        headers, str_rows, col_widths, numeric_columns = table
 
         # ヘッダー
         header_line = (
@@ -201,26 +391,19 @@ class AcademicTableFormatter:
         )
 
         # 区切り線（数値列は右寄せ）
-        separators = []
-        for i, w in enumerate(col_widths):
-            # 数値かどうかチェック
-            try:
-                if rows and i < len(rows[0]):
-                    float(rows[0][i])
-                    separators.append("-" * (w - 1) + ":")
-                else:
-                    separators.append("-" * w)
-            except (ValueError, TypeError):
-                separators.append("-" * w)
+        separators = [
+            "-" * (w - 1) + ":" if numeric else "-" * w
+            for w, numeric in zip(col_widths, numeric_columns)
+        ]
 
         separator_line = "| " + " | ".join(separators) + " |"
 
         # データ行
         data_lines = []
-        for row in rows:
+        for row in str_rows:
             line = (
                 "| "
-                + " | ".join(str(cell).ljust(w) for cell, w in zip(row, col_widths))
+                + " | ".join(cell.ljust(w) for cell, w in zip(row, col_widths))
                 + " |"
             )
             data_lines.append(line)
@@ -239,14 +422,23 @@ class AcademicTableFormatter:
         Returns:
             CSV形式の文字列
         """
-        import csv
-        from io import StringIO
-
         output = StringIO()
-        writer = csv.writer(output)
+        AcademicTableFormatter.format_csv_to(headers, rows, output)
+        return output.getvalue()
+
+    @staticmethod
+    def format_csv_to(headers: List[str], rows: List[List[str]], file: IO[str]) -> None:
+        """
+        CSV形式のデータを開いているファイルへ直接書き込む
+
+        Args:
+            headers: ヘッダー行
+            rows: データ行のリスト
+            file: 書き込み先（ファイルの場合はnewline=""で開くこと）
+        """
+        writer = csv.writer(file)
         writer.writerow(headers)
         writer.writerows(rows)
-        return output.getvalue()
 
 
 class AcademicResultFormatter:
@@ -300,20 +492,16 @@ class AcademicResultFormatter:
         return "\n".join(lines)
 
     @staticmethod
-    def format_result_summary(result: Dict[str, Any], format_type: str = "ascii") -> str:
+    def _build_summary_table(result: Dict[str, Any]) -> Tuple[List[str], List[List[str]]]:
         """
-        結果サマリーを表形式でフォーマット
+        結果サマリーの指標テーブルを構築
 
         Args:
             result: 採点結果辞書
-            format_type: 出力形式 ('ascii', 'latex', 'markdown', 'csv')
 
         Returns:
-            フォーマット済み結果文字列
+            (ヘッダー行, データ行のリスト) のタプル
         """
-        method = result.get("method", "Unknown")
-
-        # メトリクステーブル
         metrics_headers = ["指標", "値"]
         metrics_rows = []
 
@@ -337,23 +525,78 @@ class AcademicResultFormatter:
         if "total_props" in result:
             metrics_rows.append(["総命題数", str(result["total_props"])])
 
+        return metrics_headers, metrics_rows
+
+    @staticmethod
+    def format_result_summary(result: Dict[str, Any], format_type: str = "ascii") -> str:
+        """
+        結果サマリーを表形式でフォーマット
+
+        Args:
+            result: 採点結果辞書
+            format_type: 出力形式 ('ascii', 'latex', 'markdown', 'csv')
+
+        Returns:
+            フォーマット済み結果文字列
+        """
+        return AcademicResultFormatter.render_all(result, (format_type,))[format_type]
+
+    @staticmethod
+    def render_all(
+        result: Dict[str, Any], formats: Sequence[str] = ("ascii", "latex", "markdown", "csv")
+    ) -> Dict[str, str]:
+        """
+        結果サマリーを複数の形式でまとめてフォーマット
+
+        指標テーブルは一度だけ構築し、各形式のフォーマッタで共有します。
+
+        Args:
+            result: 採点結果辞書
+            formats: 出力形式のシーケンス ('ascii', 'latex', 'markdown', 'csv')
+
+        Returns:
+            出力形式をキー、フォーマット済み結果文字列を値とする辞書
+        """
+        method = result.get("method", "Unknown")
+        metrics_headers, metrics_rows = AcademicResultFormatter._build_summary_table(result)
+
+        # 文字列化と列幅の計算はすべての形式で共有する
+        table = PreparedTable.from_rows(metrics_headers, metrics_rows)
         formatter = AcademicTableFormatter()
+        rendered: Dict[str, str] = {}
+
+        for format_type in formats:
+            if format_type == "latex":
+                rendered[format_type] = formatter.render_latex_table(
+                    table,
+                    caption=f"{method}方式 採点結果",
+                    label=f"tab:{method.lower()}_results",
+                )
+            elif format_type == "markdown":
+                rendered[format_type] = formatter.render_markdown_table(table)
+            elif format_type == "csv":
+                rendered[format_type] = formatter.format_csv(table.headers, table.rows)
+            else:  # ascii
+                rendered[format_type] = formatter.render_ascii_table(
+                    table, title=f"{method}方式 採点結果"
+                )
+
+        return rendered
 
-        if format_type == "latex":
-            return formatter.format_latex_table(
-                metrics_headers,
-                metrics_rows,
-                caption=f"{method}方式 採点結果",
-                label=f"tab:{method.lower()}_results",
-            )
-        elif format_type == "markdown":
-            return formatter.format_markdown_table(metrics_headers, metrics_rows)
-        elif format_type == "csv":
-            return formatter.format_csv(metrics_headers, metrics_rows)
-        else:  # ascii
-            return formatter.format_ascii_table(
-                metrics_headers, metrics_rows, title=f"{method}方式 採点結果"
-            )
+    @staticmethod
+    def export_result_summary_csv(
+        result: Dict[str, Any], filepath: str, encoding: str = "utf-8"
+    ) -> None:
+        """
+        結果サマリーをCSV形式でファイルへ直接書き込む
+
+        Args:
+            result: 採点結果辞書
+            filepath: 出力ファイルパス
+            encoding: 文字エンコーディング
+        """
+        metrics_headers, metrics_rows = AcademicResultFormatter._build_summary_table(result)
+        export_csv_to_file(metrics_headers, metrics_rows, filepath, encoding)
 
     @staticmethod
     def format_comparison_table(
@@ -376,16 +619,17 @@ class AcademicResultFormatter:
             if not result:
                 continue
 
+            get = result.get
             row = [
                 algo_name,
-                f"{result.get('total_score', 0)}/{result.get('max_score', 0)}",
-                f"{result.get('percentage', 0.0):.1f}%",
-                f"{result.get('f_value', 0.0):.3f}" if "f_value" in result else "N/A",
-                f"{result.get('precision', 0.0):.3f}"
-                if "precision" in result
-                else "N/A",
-                f"{result.get('recall', 0.0):.3f}" if "recall" in result else "N/A",
+                f"{get('total_score', 0)}/{get('max_score', 0)}",
+                f"{get('percentage', 0.0):.1f}%",
             ]
+            # 指標が存在しない場合は0ではなくN/Aとする（値が0の場合と区別するため）
+            row.extend(
+                format(result[key], ".3f") if key in result else "N/A"
+                for key in _COMPARISON_METRIC_KEYS
+            )
             rows.append(row)
 
         formatter = AcademicTableFormatter()
@@ -414,12 +658,37 @@ def export_to_file(content: str, filepath: str, encoding: str = "utf-8") -> None
         filepath: 出力ファイルパス
         encoding: 文字エンコーディング
     """
-    from pathlib import Path
-
     output_path = Path(filepath)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with output_path.open("w", encoding=encoding) as f:
         f.write(content)
 
-    logger.info(f"結果をエクスポートしました: {filepath}")
+    logger.info("結果をエクスポートしました: %s", filepath)
+
+
+def export_csv_to_file(
+    headers: List[str], rows: List[List[str]], filepath: str, encoding: str = "utf-8"
+) -> None:
+    """
+    表データをCSV形式でファイルへ直接書き込む
+
+    文字列を一度組み立ててから書き出すexport_to_fileと異なり、
+    csv.writerでファイルへ直接出力します。
+
+    Args:
+        headers: ヘッダー行
+        rows: データ行のリスト
+        filepath: 出力ファイルパス
+        encoding: 文字エンコーディング
+    """
+    output_path = Path(filepath)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # csvモジュールの改行処理に任せるためnewline=""で開く
+    with output_path.open(
+        "w", encoding=encoding, newline="", buffering=constants.CSV_BUFFER_SIZE
+    ) as f:
+        AcademicTableFormatter.format_csv_to(headers, rows, f)
+
+    logger.info("結果をエクスポートしました: %s", filepath)
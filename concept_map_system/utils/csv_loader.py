@@ -8,12 +8,46 @@ CSVファイルの読み込みと検証を統一的に処理します。
 
 import csv
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from ..core import constants
 from ..core.exceptions import CSVLoadError
 
 
+def _iter_row_dicts(
+    reader: Iterator[List[str]], fieldnames: List[str]
+) -> Iterator[Dict[str, Any]]:
+    """
+    csv.readerの各行をcsv.DictReaderと同じ規則で辞書に変換する
+
+    空行は読み飛ばし、列が足りない行はNoneで補い、
+    余分な列はキーNoneのリストにまとめます。
+
+    Args:
+        reader: csv.readerオブジェクト（ヘッダー行は読み込み済み）
+        fieldnames: ヘッダー行
+
+    Yields:
+        各行の辞書
+    """
+    field_count = len(fieldnames)
+    for row in reader:
+        row_length = len(row)
+        if row_length == field_count:
+            yield dict(zip(fieldnames, row))
+        elif row_length == 0:
+            continue
+        elif row_length > field_count:
+            row_dict: Dict[Any, Any] = dict(zip(fieldnames, row))
+            row_dict[None] = row[field_count:]
+            yield row_dict
+        else:
+            row_dict = dict(zip(fieldnames, row))
+            for key in fieldnames[row_length:]:
+                row_dict[key] = None
+            yield row_dict
+
+
 class CSVLoader:
     """CSV読み込み共通クラス"""
 
@@ -56,25 +90,31 @@ class CSVLoader:
         data: List[Dict[str, Any]] = []
 
         try:
-            with file_path.open(encoding=constants.FILE_ENCODING) as f:
-                reader = csv.DictReader(f)
+            # newline=""はcsvモジュールの要件（引用符内の改行を正しく扱うため）
+            with file_path.open(
+                encoding=constants.FILE_ENCODING, newline="", buffering=constants.CSV_BUFFER_SIZE
+            ) as f:
+                # DictReaderは行ごとにPythonレベルの処理を挟むため、
+                # csv.readerで読み込み、同じ規則で辞書に変換する
+                reader = csv.reader(f)
 
                 # ヘッダー確認
-                if reader.fieldnames is None:
+                fieldnames = next(reader, None)
+                if fieldnames is None:
                     msg = f"CSVファイルが空です: {filepath}"
                     raise CSVLoadError(msg)
 
                 # 必須フィールド確認
                 if required_fields:
                     missing_fields = [
-                        field for field in required_fields if field not in reader.fieldnames
+                        field for field in required_fields if field not in fieldnames
                     ]
                     if missing_fields:
                         msg = f"必要な列が見つかりません: {missing_fields}\nファイル: {filepath}"
                         raise CSVLoadError(msg)
 
                 # データ読み込み
-                for row_num, row in enumerate(reader, start=1):
+                for row_num, row in enumerate(_iter_row_dicts(reader, fieldnames), start=1):
                     # バリデーション実行
                     if row_validator:
                         try:
@@ -6,13 +6,17 @@
 結果表示のための共通フォーマット関数を提供します。
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List
 
 
+@lru_cache(maxsize=None)
 def create_separator(char: str = "=", length: int = 60) -> str:
     """
     セパレーター文字列を作成
 
+    同じ文字と長さの組み合わせには同一の文字列オブジェクトを返します。
+
     Args:
         char: セパレーター文字（デフォルト: "="）
         length: セパレーターの長さ（デフォルト: 60）
@@ -85,12 +89,15 @@ def format_f_metrics(
          'Recall（再現率）: 0.900',
          'F値: 0.874']
     """
-    output = [title]
-    output.append(f"完全一致数: {results.get(matched_count_key, 0)}")
-    output.append(f"Precision（適合率）: {results.get(precision_key, 0):.3f}")
-    output.append(f"Recall（再現率）: {results.get(recall_key, 0):.3f}")
-    output.append(f"F値: {results.get(f_value_key, 0):.3f}")
-    return output
+    # f文字列は定義時にコンパイル済みのため、リストリテラルで一度に構築する
+    get = results.get
+    return [
+        title,
+        f"完全一致数: {get(matched_count_key, 0)}",
+        f"Precision（適合率）: {get(precision_key, 0):.3f}",
+        f"Recall（再現率）: {get(recall_key, 0):.3f}",
+        f"F値: {get(f_value_key, 0):.3f}",
+    ]
 
 
 def format_score_display(
@@ -115,12 +122,12 @@ def format_score_display(
         >>> format_score_display(score_counts, score_labels)
         ['【採点内訳】', '完全一致: 10', '向き不一致: 5', 'ラベル不一致: 3', '不一致: 2']
     """
+    # スコアの降順でソート（ラベルはソート時に併せて取り出す）
     output = [title]
-    # スコアの降順でソート
-    for score in sorted(score_labels.keys(), reverse=True):
-        label = score_labels[score]
-        count = score_counts.get(score, 0)
-        output.append(f"{label}: {count}")
+    output.extend(
+        f"{label}: {score_counts.get(score, 0)}"
+        for score, label in sorted(score_labels.items(), reverse=True)
+    )
     return output
 
 
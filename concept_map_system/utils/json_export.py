@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+"""
+JSON出力ユーティリティ
+
+orjsonが利用可能な場合はそれを使用し、利用できない場合は標準のjsonモジュールで出力します。
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def save_json(data: Any, filepath: str) -> None:
+    """
+    データをJSONファイルに保存
+
+    インデント2、非ASCII文字はエスケープせずUTF-8で出力します。
+    辞書の数値キー（score_countsなど）は文字列キーとして出力されます。
+
+    Args:
+        data: 保存するデータ
+        filepath: 出力ファイルパス
+
+    Raises:
+        TypeError: JSONに変換できない値が含まれている場合
+    """
+    output_path = Path(filepath)
+
+    if _ORJSON_AVAILABLE:
+        output_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
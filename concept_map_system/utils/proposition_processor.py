@@ -57,85 +57,55 @@ def decompose_qualifiers(propositions: List[Dict[str, Any]]) -> List[Dict[str, A
         {'id': '1_q_1', 'antes': '0', 'conq': '1', 'type': 'Qualifier', 'original_id': '1', 'is_decomposed': True}
     """
     result: List[Dict[str, Any]] = []
+    # ループ内で繰り返し参照するメソッドをローカル変数に束縛
+    append = result.append
 
     for prop in propositions:
-        decomposed = _decompose_single_proposition(prop)
-        result.extend(decomposed)
-
-    return result
-
-
-def _decompose_single_proposition(prop: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """
-    単一の命題を分解する
-
-    Args:
-        prop: 命題データ
-
-    Returns:
-        分解後の命題リスト
-    """
-    antes_str = str(prop.get("antes", "")).strip()
-    conq_str = str(prop.get("conq", "")).strip()
-
-    # antesまたはconqが空の場合はスキップ
-    if not antes_str or not conq_str:
-        logger.debug(f"空のantes/conqを持つ命題をスキップ: {prop.get('id')}")
-        return []
-
-    # antesノードをスペースで分割
-    antes_nodes = antes_str.split()
-
-    # 単一antesノードの場合はそのまま返す
-    if len(antes_nodes) <= 1:
-        return [prop.copy()]
-
-    # 複数antesノードの場合は分解
-    return _create_decomposed_links(prop, antes_nodes, conq_str)
-
-
-def _create_decomposed_links(
-    prop: Dict[str, Any], antes_nodes: List[str], conq_str: str
-) -> List[Dict[str, Any]]:
-    """
-    分解されたリンクを作成する
-
-    Args:
-        prop: 元の命題データ
-        antes_nodes: antesノードのリスト
-        conq_str: conqノード
-
-    Returns:
-        分解後の命題リスト
-    """
-    link_type = str(prop.get("type", ""))
-    prop_id = str(prop.get("id", ""))
-    base_node = antes_nodes[0]
-    qualifier_nodes = antes_nodes[1:]
-
-    result: List[Dict[str, Any]] = []
-
-    # メインリンク: 基準ノード → conq (元のtype)
-    main_link = {
-        "id": f"{prop_id}_main",
-        "antes": base_node,
-        "conq": conq_str,
-        "type": link_type,
-        "original_id": prop_id,
-        "is_decomposed": True,
-    }
-    result.append(main_link)
-
-    # Qualifierリンク: 基準ノード → 各限定ノード (Qualifier)
-    for idx, qualifier_node in enumerate(qualifier_nodes, start=1):
-        qualifier_link = {
-            "id": f"{prop_id}_q_{idx}",
-            "antes": base_node,
-            "conq": qualifier_node,
-            "type": "Qualifier",
-            "original_id": prop_id,
-            "is_decomposed": True,
-        }
-        result.append(qualifier_link)
+        get = prop.get
+        antes_str = str(get("antes", "")).strip()
+        conq_str = str(get("conq", "")).strip()
+
+        # antesまたはconqが空の場合はスキップ
+        if not antes_str or not conq_str:
+            logger.debug("空のantes/conqを持つ命題をスキップ: %s", get("id"))
+            continue
+
+        # antesノードをスペースで分割
+        antes_nodes = antes_str.split()
+
+        # 単一antesノードの場合はそのまま返す
+        if len(antes_nodes) == 1:
+            append(prop.copy())
+            continue
+
+        # 複数antesノードの場合は分解
+        prop_id = str(get("id", ""))
+        base_node = antes_nodes[0]
+
+        # メインリンク: 基準ノード → conq (元のtype)
+        append(
+            {
+                "id": prop_id + "_main",
+                "antes": base_node,
+                "conq": conq_str,
+                "type": str(get("type", "")),
+                "original_id": prop_id,
+                "is_decomposed": True,
+            }
+        )
+
+        # Qualifierリンク: 基準ノード → 各限定ノード (Qualifier)
+        qualifier_prefix = prop_id + "_q_"
+        for idx in range(1, len(antes_nodes)):
+            append(
+                {
+                    "id": qualifier_prefix + str(idx),
+                    "antes": base_node,
+                    "conq": antes_nodes[idx],
+                    "type": "Qualifier",
+                    "original_id": prop_id,
+                    "is_decomposed": True,
+                }
+            )
 
     return result
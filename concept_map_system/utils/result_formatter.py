@@ -6,12 +6,31 @@
 ExecutionResultのリストを処理し、フォーマットされた結果を提供する
 """
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Type
 
 from ..core.algorithm_registry import AlgorithmRegistry
+from ..core.base_algorithm import BaseAlgorithm
 from ..core.executor import ExecutionResult
 
 
+@lru_cache(maxsize=32)
+def _formatting_instance(algorithm_class: Type[BaseAlgorithm]) -> BaseAlgorithm:
+    """
+    結果の整形に使うアルゴリズムのインスタンスを取得（クラスごとに再利用する）
+
+    クラスをキーにしているため、同じ名前で別のクラスが再登録された場合は
+    新しいインスタンスが生成されます。
+
+    Args:
+        algorithm_class: アルゴリズムクラス
+
+    Returns:
+        アルゴリズムのインスタンス
+    """
+    return algorithm_class()  # type: ignore[call-arg]
+
+
 class ResultFormatter:
     """採点結果のフォーマッティングユーティリティ"""
 
@@ -30,21 +49,16 @@ class ResultFormatter:
                 - formatted_results: フォーマット済み結果のリスト
                 - all_results: 全結果の辞書
         """
-        success_count = 0
-        all_results = {}
-        formatted_results = []
-
-        for result in results:
-            formatted_entry = ResultFormatter._format_single_result(result)
-            formatted_results.append(formatted_entry)
-
-            if result.success:
-                success_count += 1
-                if result.result:
-                    all_results[result.algorithm_name] = result.result
+        format_single = ResultFormatter._format_single_result
+        formatted_results = [format_single(result) for result in results]
+        all_results = {
+            result.algorithm_name: result.result
+            for result in results
+            if result.success and result.result
+        }
 
         return {
-            "success_count": success_count,
+            "success_count": sum(1 for result in results if result.success),
             "total_count": len(results),
             "formatted_results": formatted_results,
             "all_results": all_results,
@@ -69,9 +83,10 @@ class ResultFormatter:
             "error": result.error,
         }
 
-        if result.success:
-            algo = AlgorithmRegistry.get_algorithm(result.algorithm_name)
-            if algo and result.result:
+        if result.success and result.result:
+            algorithm_class = AlgorithmRegistry.get_algorithm_class(result.algorithm_name)
+            if algorithm_class is not None:
+                algo = _formatting_instance(algorithm_class)
                 formatted_entry["formatted_output"] = algo.format_results(result.result)
 
         return formatted_entry
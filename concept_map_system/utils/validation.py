@@ -6,11 +6,18 @@
 概念マップデータの妥当性をチェックするための検証関数を提供します。
 """
 
-from typing import Any, Dict, List, Optional, cast
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from ..core.exceptions import ValidationError
 from ..core.types import PropositionData
 
+# 命題データの必須フィールド
+_DEFAULT_REQUIRED_FIELDS: Tuple[str, ...] = ("id", "antes", "conq")
+
+# 必須フィールド不足時のメッセージ（書式化は例外を送出するときまで遅延する）
+_MISSING_FIELDS_MESSAGE = "必須フィールドが不足しています: %s, データ: %s"
+
 
 def _normalize_string(value: Any) -> str:
     """
@@ -22,6 +29,9 @@ def _normalize_string(value: Any) -> str:
     Returns:
         トリムされた文字列
     """
+    # 命題データの値はほとんどが文字列のため、その場合はstr()を省略する
+    if type(value) is str:
+        return value.strip()
     return str(value).strip()
 
 
@@ -35,7 +45,119 @@ def _is_empty_string(value: Any) -> bool:
     Returns:
         空または空白のみの場合True
     """
-    return not _normalize_string(value)
+    # 文字列の場合はトリムした文字列を作らずに判定する
+    if type(value) is str:
+        return not value or value.isspace()
+    return not str(value).strip()
+
+
+def _find_empty_field(prop_id: Any, antes: Any, conq: Any) -> Optional[str]:
+    """
+    id/antes/conqのうち空のものを探し、エラーメッセージを返す
+
+    Args:
+        prop_id: 命題ID
+        antes: antesノード
+        conq: conqノード
+
+    Returns:
+        空のフィールドがあればエラーメッセージ、なければNone
+    """
+    # IDの形式チェック（空でないこと）
+    if _is_empty_string(prop_id):
+        return "IDが空です"
+
+    # ノードIDの形式チェック（空でないこと）
+    if _is_empty_string(antes):
+        return "antesノードが空です"
+
+    if _is_empty_string(conq):
+        return "conqノードが空です"
+
+    return None
+
+
+@lru_cache(maxsize=32)
+def _normalize_allowed_types(allowed_types: Tuple[str, ...]) -> FrozenSet[str]:
+    """
+    許可されたリンクタイプを正規化した集合を作成（同じ許可リストでは再利用する）
+
+    Args:
+        allowed_types: 許可されたタイプのタプル
+
+    Returns:
+        トリムして小文字化したタイプの集合
+    """
+    return frozenset(_normalize_string(t).lower() for t in allowed_types)
+
+
+def _find_missing_fields(
+    prop: Dict[str, Any], required_fields: Sequence[str]
+) -> Optional[List[str]]:
+    """
+    不足している必須フィールドを探す
+
+    Args:
+        prop: 命題データ
+        required_fields: 必須フィールドのリスト
+
+    Returns:
+        不足しているフィールドのリスト（不足がなければNone）
+    """
+    # 正常時は一覧を作らずに走査し、不足を見つけた場合のみ一覧を作成する
+    get = prop.get
+    for field in required_fields:
+        if not get(field):
+            break
+    else:
+        return None
+
+    return [field for field in required_fields if not get(field)]
+
+
+def _validation_error(error_args: Tuple[Any, ...]) -> ValidationError:
+    """
+    検査結果からValidationErrorを作成
+
+    例外を送出しない検証経路では命題のreprを作らずに済むよう、
+    メッセージの書式化はここで初めて行います。
+
+    Args:
+        error_args: (書式, 引数...) のタプル
+
+    Returns:
+        ValidationError: 書式化済みのメッセージを持つ例外
+    """
+    return ValidationError(error_args[0] % error_args[1:])
+
+
+def _check_proposition(prop: PropositionData) -> Optional[Tuple[Any, ...]]:
+    """
+    命題データの完全性を検査し、不正な場合はエラーメッセージの書式と引数を返す
+
+    例外を使わずに判定できるため、命題リストの検証ループから直接呼び出せます。
+
+    Args:
+        prop: 命題データ
+
+    Returns:
+        不正な場合は (書式, 引数...) のタプル、正常な場合はNone
+    """
+    # フィールドは固定（id/antes/conq）のため、汎用の走査を使わずに一度ずつ取り出す
+    get = prop.get
+    fields = (get("id"), get("antes"), get("conq"))
+
+    # 必須フィールドの存在チェック
+    if not (fields[0] and fields[1] and fields[2]):
+        missing_fields = [
+            field for field, value in zip(_DEFAULT_REQUIRED_FIELDS, fields) if not value
+        ]
+        return (_MISSING_FIELDS_MESSAGE, missing_fields, prop)
+
+    error = _find_empty_field(*fields)
+    if error is not None:
+        return ("%s: %s", error, prop)
+    return None
 
 
 def validate_proposition_fields(
@@ -51,14 +173,11 @@ def validate_proposition_fields(
     Raises:
         ValidationError: 必須フィールドが不足している場合
     """
-    if required_fields is None:
-        required_fields = ["id", "antes", "conq"]
-
-    missing_fields = [field for field in required_fields if field not in prop or not prop[field]]
-
-    if missing_fields:
-        msg = f"必須フィールドが不足しています: {missing_fields}, データ: {prop}"
-        raise ValidationError(msg)
+    missing_fields = _find_missing_fields(
+        prop, _DEFAULT_REQUIRED_FIELDS if required_fields is None else required_fields
+    )
+    if missing_fields is not None:
+        raise _validation_error((_MISSING_FIELDS_MESSAGE, missing_fields, prop))
 
 
 def validate_proposition_data(prop: PropositionData) -> None:
@@ -71,22 +190,9 @@ def validate_proposition_data(prop: PropositionData) -> None:
     Raises:
         ValidationError: データが不正な場合
     """
-    # 必須フィールドの存在チェック
-    validate_proposition_fields(cast(Dict[str, Any], prop), ["id", "antes", "conq"])
-
-    # IDの形式チェック（空でないこと）
-    if _is_empty_string(prop["id"]):
-        msg = f"IDが空です: {prop}"
-        raise ValidationError(msg)
-
-    # ノードIDの形式チェック（空でないこと）
-    if _is_empty_string(prop["antes"]):
-        msg = f"antesノードが空です: {prop}"
-        raise ValidationError(msg)
-
-    if _is_empty_string(prop["conq"]):
-        msg = f"conqノードが空です: {prop}"
-        raise ValidationError(msg)
+    error_args = _check_proposition(prop)
+    if error_args is not None:
+        raise _validation_error(error_args)
 
 
 def validate_node_ids(node_ids: str) -> bool:
@@ -109,12 +215,11 @@ def validate_node_ids(node_ids: str) -> bool:
         >>> validate_node_ids("   ")
         False
     """
-    if _is_empty_string(node_ids):
-        return False
-
-    # スペース区切りで分割し、各IDが空でないことを確認
-    ids = _normalize_string(node_ids).split()
-    return all(id_str for id_str in ids)
+    # 引数なしのsplit()は空白の連続を区切りとして扱い、空のIDを返さないため、
+    # 分割結果が1つ以上あれば有効
+    if type(node_ids) is not str:
+        node_ids = str(node_ids)
+    return bool(node_ids.split())
 
 
 def validate_link_type(link_type: str, allowed_types: Optional[List[str]] = None) -> bool:
@@ -140,15 +245,17 @@ def validate_link_type(link_type: str, allowed_types: Optional[List[str]] = None
         >>> validate_link_type("")
         False
     """
+    # 正規化は一度だけ行い、空チェックと許可リストとの比較で共有する
+    normalized_type = _normalize_string(link_type)
+    if not normalized_type:
+        return False
+
     if allowed_types is None:
         # 任意のタイプを許可（空でなければOK）
-        return not _is_empty_string(link_type)
+        return True
 
     # 大文字小文字を区別せずに比較
-    normalized_type = _normalize_string(link_type).lower()
-    normalized_allowed = [_normalize_string(t).lower() for t in allowed_types]
-
-    return normalized_type in normalized_allowed
+    return normalized_type.lower() in _normalize_allowed_types(tuple(allowed_types))
 
 
 def validate_propositions_list(
@@ -167,16 +274,18 @@ def validate_propositions_list(
     Raises:
         ValidationError: strict=Trueで検証エラーが発生した場合
     """
-    invalid_prop_ids: List[str] = []
-
-    for prop in propositions:
-        try:
-            validate_proposition_data(prop)
-        except ValidationError:
-            prop_id = prop.get("id", "N/A")
-            invalid_prop_ids.append(str(prop_id))
-
-            if strict:
-                raise
-
-    return invalid_prop_ids
+    # ループ内で繰り返し参照する関数をローカル変数に束縛
+    # （try/exceptを使わないよう、例外を送出しない検査関数で判定する）
+    check = _check_proposition
+
+    if strict:
+        # 最初の不正な命題で例外を送出する
+        for prop in propositions:
+            error_args = check(prop)
+            if error_args is not None:
+                raise _validation_error(error_args)
+        return []
+
+    invalid_ids = [prop.get("id", "N/A") for prop in propositions if check(prop) is not None]
+    # IDはほとんどが文字列のため、文字列以外の場合のみstr()で変換する
+    return [prop_id if type(prop_id) is str else str(prop_id) for prop_id in invalid_ids]